@@ -6,13 +6,20 @@ version = f"3.10.4"
 author = "Michael"
 
 import os
+import codecs
 import sys
+import shutil
+import json
 import time
+import bisect
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from collections import OrderedDict
 import re
-from typing import List, Tuple, Optional
+from typing import Dict, FrozenSet, List, Tuple, Optional
 import msvcrt  # Windows-specific for keyboard input
+import ctypes  # Windows console handle waits (kernel32)
 import math  # <-- add this
 
 try:
@@ -34,29 +41,157 @@ except ImportError:
     class Style:
         DIM = NORMAL = BRIGHT = RESET_ALL = ""
 
+try:
+    from mutagen import File as MutagenFile  # reads duration from the file header only
+except ImportError:
+    MutagenFile = None  # fall back to decoding with pygame.mixer.Sound
+
+# ANSI sequences bound once as plain str constants (empty when colorama is missing)
+_G, _Y, _B, _M = Fore.GREEN, Fore.YELLOW, Fore.BLUE, Fore.MAGENTA
+_C, _W, _R, _RS = Fore.CYAN, Fore.WHITE, Fore.RED, Style.RESET_ALL
+# Lyric row prefixes: current line (♪ marker) and surrounding lines (cyan, indented)
+_CURRENT_PREFIX = "♪ "
+_CURRENT_PLAIN_PREFIX = f"{_W}♪ "
+_OTHER_PREFIX = f"{_C}  "
+# "Move to row N, column 1 and erase the line" for the first screen rows, built once
+_ROW_PREFIXES = tuple(f"\033[{row};1H\033[2K" for row in range(1, 129))
+# Lyric area shown for songs without an .lrc file (pre-baked; redrawn every frame)
+_NO_LYRICS_LINES = (f"{_Y}  No lyrics found for this song{_RS}",)
+
 CFG_FILENAME = "player-config.cfg"
 SONGS_DIRNAME = "songs"
+DURATION_CACHE_FILENAME = ".durations.json"  # persisted song durations, keyed by path + mtime + size
+DURATION_CACHE_MAX = 512  # least recently used durations beyond this are dropped
 LYRICS_LINE_SWITCHING_ON_END = True # Whether to switch to next line when the current line ends
+WINDOW_BEFORE = 2  # lyric lines shown above the current one
+WINDOW_AFTER = 3   # current line plus lines shown below it
+MIN_FRAME_INTERVAL = 1 / 60  # timed redraws never come faster than a 60Hz display refresh
+STD_INPUT_HANDLE = -10
+WAIT_OBJECT_0 = 0
+
+
+def _separator_width() -> int:
+    """60 columns, or less on narrow terminals so separators never wrap onto a second row"""
+    return max(1, min(60, shutil.get_terminal_size((80, 24)).columns - 1))
+
+
+# msvcrt scan codes that follow a 0x00/0xE0 prefix byte
+_EXT_KEYS = {b'K': 'LEFT', b'M': 'RIGHT', b'H': 'UP', b'P': 'DOWN'}
+# Printable (lowercased) keys the player reacts to
+_CTRL_KEYS = {' ': 'SPACE', 'n': 'NEXT', 'p': 'PREV', 'q': 'QUIT', 'v': 'VSWITCH'}
+
+
+
+# LRC patterns, compiled once at import
+# Any <mm:ss.xx> tag and the text until the next tag or end-of-line
+_WORD_RE = re.compile(r'<(\d{2}:\d{2}\.\d{2,3})>([^<]*?)(?=<|$)')
+# [timestamp] text, one match per line when scanning a whole file; runs on the raw
+# UTF-8 bytes so only the captured groups need decoding (a trailing \r is stripped later)
+_LINE_RE = re.compile(rb'^[^\S\n]*\[(\d{2}:\d{2}\.\d{2,3})\][^\S\n]*(.*)$', re.MULTILINE)
+# mm:ss.xxx inside a tag (brackets optional)
+_TS_RE = re.compile(r'(\d+):(\d{2})(?:\.(\d{1,3}))?')
+
+# normalize_filename patterns
+_FEAT_SEP_RE = re.compile(r"\s[_xX]\s")
+_FEAT_WORD_RE = re.compile(r"\b(feat\.?|featuring|ft\.?|with)\b")
+_SEP_RE = re.compile(r'[\-\(\)\[\]]')
+_UNDERSCORE_RE = re.compile(r'_+')
+_BPM_RE = re.compile(r'\s*-\s*\d{2,3}\s*-\s*')
+_QM_RE = re.compile(r'\s*qm\s*$')
+_EXPLICIT_RE = re.compile(r'\b(deluxe|remaster(ed)?|explicit|clean|radio|edit|version|main|full|mix|mono|stereo)\b')
+_FEAT_RE = re.compile(r'\s*feat[^a-z]*\s*')
+_NUM_RE = re.compile(r'\b\d+\b')
+_WS_RE = re.compile(r'\s+')
+
+# Words ignored by calculate_match_score's overlap comparison
+_MATCH_STOP_WORDS = frozenset({
+    'feat', 'featuring', 'ft', 'with', 'and', '&',
+    'explicit', 'clean', 'radio', 'edit', 'version', 'deluxe', 'remaster', 'remastered',
+    'main', 'full', 'mix'
+})
+
 
+def _content_words(words: List[str]) -> FrozenSet[str]:
+    """Distinct words of a normalized name minus the stop words (used for overlap scoring)"""
+    return frozenset(words).difference(_MATCH_STOP_WORDS)
 
 
 class LyricWord:
+    # Songs hold hundreds of these; slots drop the per-instance __dict__
+    __slots__ = ('timestamp', 'text', 'end_timestamp', '_reveal_times', '_reveal_duration',
+                 '_reveal_cache', '_sung', '_unsung')
+
     def __init__(self, timestamp: float, text: str, end_timestamp: Optional[float] = None):
         self.timestamp = timestamp
         self.text = text
         # Optional explicit end time for this word (e.g., <start>word<end>)
         self.end_timestamp = end_timestamp
+        # Per-character reveal thresholds (lyrics time), memoized for one word duration
+        self._reveal_times: Optional[List[float]] = None
+        self._reveal_duration: Optional[float] = None
+        # Rendered word for each revealed character count 0..len(text); built on first animation
+        self._reveal_cache: Optional[List[str]] = None
+        # Fully sung (white) and not yet sung (blue) renderings
+        self._sung = f"{_W}{text}{_RS}"
+        self._unsung = f"{_B}{text}{_RS}"
+
+    def reveal_times(self, duration: float) -> List[float]:
+        """Times at which each character of this word starts to be revealed"""
+        if self._reveal_times is None or self._reveal_duration != duration:
+            time_per_char = duration / max(1, len(self.text))
+            self._reveal_times = [
+                self.timestamp + (i + temp_ratio) * time_per_char for i in range(len(self.text))
+            ]
+            self._reveal_duration = duration
+        return self._reveal_times
 
     def __repr__(self):
         return f"LyricWord({self.timestamp:.3f}, '{self.text}')"
 
 
 class LyricLine:
+    __slots__ = ('timestamp', 'text', 'words', 'is_precise', '_clean_text', '_word_ts',
+                 '_word_durations', '_render_cache')
+
     def __init__(self, timestamp: float, text: str, words: List['LyricWord'] = None):
         self.timestamp = timestamp
         self.text = text
         self.words = words or []
         self.is_precise = len(self.words) > 0
+        # Display text without timing tags
+        self._clean_text = "".join(w.text for w in self.words) if self.words else text
+        # Word start times, for bisecting to the word being sung
+        self._word_ts: List[float] = [w.timestamp for w in self.words]
+        # Reveal duration of each word; filled by set_word_durations once the next line is known
+        self._word_durations: Optional[List[float]] = None
+        # Rendered (non-current) display line; filled on first render
+        self._render_cache: Optional[str] = None
+
+    def set_word_durations(self, next_line_timestamp: Optional[float] = None):
+        """Precompute how long each word takes to reveal.
+
+        A word lasts until its explicit end tag, else until the next word. The last word runs
+        to the next line's start if known, otherwise the median inter-word gap (or 0.5s).
+        """
+        words = self.words
+        ts = self._word_ts
+        durations: List[float] = []
+        for i, word in enumerate(words):
+            if word.end_timestamp is not None:
+                raw_duration = max(0.0, word.end_timestamp - word.timestamp)
+            elif i + 1 < len(words):
+                raw_duration = max(0.0, ts[i + 1] - word.timestamp)
+            elif next_line_timestamp is not None:
+                raw_duration = max(0.0, next_line_timestamp - word.timestamp)
+            else:
+                gaps = sorted(max(0.0, ts[j + 1] - ts[j]) for j in range(len(ts) - 1))
+                if gaps:
+                    mid = len(gaps) // 2
+                    raw_duration = gaps[mid] if len(gaps) % 2 == 1 else (gaps[mid - 1] + gaps[mid]) / 2.0
+                else:
+                    raw_duration = 0.5
+            durations.append(raw_duration if raw_duration > 0 else 0.5)
+        self._word_durations = durations
 
     def __repr__(self):
         return f"LyricLine({self.timestamp:.3f}, '{self.text}', words={len(self.words)})"
@@ -65,37 +200,27 @@ class LyricLine:
 class LRCParser:
     @staticmethod
     def parse_timestamp(timestamp_str: str) -> float:
-        """Parse LRC timestamp like [00:08.987] or <00:08.987> to seconds"""
-        # Remove brackets/angle brackets and parse mm:ss.sss
-        time_part = timestamp_str.strip('[]<>')
-        if ':' not in time_part:
+        """Parse LRC timestamp like 00:08.987 (optionally in [] or <>) to seconds"""
+        m = _TS_RE.search(timestamp_str)
+        if not m:
             return 0.0
 
-        try:
-            parts = time_part.split(':')
-            minutes = int(parts[0])
-            seconds_parts = parts[1].split('.')
-            seconds = int(seconds_parts[0])
-            milliseconds = int(seconds_parts[1].ljust(3, '0')[:3]) if len(seconds_parts) > 1 else 0
-
-            return minutes * 60 + seconds + milliseconds / 1000.0
-        except (ValueError, IndexError):
-            return 0.0
+        minutes, seconds, frac = m.groups()
+        milliseconds = int(frac.ljust(3, '0')) if frac else 0
+        return int(minutes) * 60 + int(seconds) + milliseconds / 1000.0
 
     @staticmethod
     def parse_precise_lrc_line(line: str) -> Tuple[float, List[LyricWord]]:
         """Parse a precise LRC line with word-by-word timing"""
         words: List[LyricWord] = []
 
-        # Pattern to match any tag and the text until the next tag or end-of-line.
+        # Match any tag and the text until the next tag or end-of-line (_WORD_RE).
         # If the text is empty, we treat this as a closing tag for the previous word's end.
-        word_pattern = r'<(\d{2}:\d{2}\.\d{2,3})>([^<]*?)(?=<|$)'
-
         last_word: Optional[LyricWord] = None
-        for match in re.finditer(word_pattern, line):
+        for match in _WORD_RE.finditer(line):
             timestamp_str = match.group(1)
             segment_text = match.group(2)
-            ts = LRCParser.parse_timestamp(f'<{timestamp_str}>')
+            ts = LRCParser.parse_timestamp(timestamp_str)
 
             if segment_text == "":
                 # This is most likely an end timestamp like <mm:ss.xx> immediately before
@@ -122,41 +247,44 @@ class LRCParser:
             return lyrics
 
         try:
-            with open(lrc_path, 'r', encoding='utf-8') as f:
+            with open(lrc_path, 'rb') as f:
                 content = f.read()
+            # Drop a UTF-8 BOM so the first line can match
+            if content.startswith(codecs.BOM_UTF8):
+                content = content[len(codecs.BOM_UTF8):]
+
+            # One scan over the whole file picks out every [timestamp] text line;
+            # lines that don't start with a timestamp are never visited (or decoded) in Python
+            for match in _LINE_RE.finditer(content):
+                timestamp_str = match.group(1).decode('ascii')
+                text_content = match.group(2).decode('utf-8').strip()
+
+                # Skip empty text or metadata lines
+                if text_content and not text_content.startswith('[') and not text_content.startswith('tool:'):
+                    line_timestamp = LRCParser.parse_timestamp(timestamp_str)
+
+                    # Check if this line contains precise word timing; a line without
+                    # any <mm:ss.xx> tags yields no words and stays a standard line
+                    if '<' in text_content:
+                        # Parse precise timing
+                        first_word_timestamp, words = LRCParser.parse_precise_lrc_line(text_content)
+                        # Use the line timestamp if available, otherwise use first word timestamp
+                        lyric_line = LyricLine(line_timestamp, text_content, words)
+                    else:
+                        # Standard LRC line
+                        lyric_line = LyricLine(line_timestamp, text_content)
 
-            # Pattern to match LRC lines: [timestamp] text
-            line_pattern = r'\[(\d{2}:\d{2}\.\d{2,3})\]\s*(.*)'
-
-            for line in content.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
-
-                match = re.match(line_pattern, line)
-                if match:
-                    timestamp_str = match.group(1)
-                    text_content = match.group(2).strip()
-
-                    # Skip empty text or metadata lines
-                    if text_content and not text_content.startswith('[') and not text_content.startswith('tool:'):
-                        line_timestamp = LRCParser.parse_timestamp(f'[{timestamp_str}]')
-
-                        # Check if this line contains precise word timing
-                        if '<' in text_content and '>' in text_content:
-                            # Parse precise timing
-                            first_word_timestamp, words = LRCParser.parse_precise_lrc_line(text_content)
-                            # Use the line timestamp if available, otherwise use first word timestamp
-                            lyric_line = LyricLine(line_timestamp, text_content, words)
-                        else:
-                            # Standard LRC line
-                            lyric_line = LyricLine(line_timestamp, text_content)
-
-                        lyrics.append(lyric_line)
+                    lyrics.append(lyric_line)
 
             # Sort by timestamp
             lyrics.sort(key=lambda x: x.timestamp)
 
+            # Word durations depend on the following line, so fill them in after sorting
+            for i, lyric in enumerate(lyrics):
+                if lyric.words:
+                    next_line_timestamp = lyrics[i + 1].timestamp if i + 1 < len(lyrics) else None
+                    lyric.set_word_durations(next_line_timestamp)
+
         except Exception as e:
             print(f"Error parsing LRC file {lrc_path}: {e}")
 
@@ -170,19 +298,39 @@ class MusicPlayer:
         self.cfg_path = base_dir / CFG_FILENAME
         self.current_song_index = 0
         self.playlist = []
+        self._playlist_len = 0
         self.is_playing = False
         self.is_paused = False
         self.current_lyrics = []
+        self._lyric_ts: List[float] = []  # sorted timestamps of current_lyrics, for bisect
+        self._lyric_cursor = -1  # last index returned by get_current_lyric_index
+        self._current_lyrics_duration_estimate: Optional[float] = None
+        # True when any line has word timing; plain LRC tracks redraw on a coarser tick
+        self._is_precise_track = False
         self.current_lyric_index = 0
-        self.start_time = 0.0
-        self.pause_start_time = 0.0
-        self.total_pause_time = 0.0
+        # Playback clock: position = time.monotonic() - _time_base while playing.
+        # _time_base only changes on play/pause/seek/resync; _paused_pos is frozen while paused.
+        self._time_base = 0.0
+        self._paused_pos = 0.0
+        # Seqlock counter: odd while a clock update is being written (see _update_clock)
+        self._clock_seq = 0
+        # Song position passed to the last play() call; mixer get_pos() counts from there
+        self._play_start_pos = 0.0
+        self._last_clock_sync = 0.0
         # seeking and timing helpers
-        self.seek_offset = 0.0  # kept for compatibility; not used for seek math
         self._audio_lock = threading.RLock()  # serialize audio ops
         self._last_seek_at = 0.0
-        self._min_seek_interval = 0.12  # debounce rapid arrow taps ~120ms
-        self._song_duration_cache = {}
+        self._min_seek_interval = 0.08  # coalesce rapid arrow taps ~80ms
+        self._loaded_path: Optional[Path] = None  # file currently loaded into pygame.mixer.music
+        self._pending_seek_delta = 0.0
+        self._seek_timer = None  # threading.Timer that commits the pending seek
+        # Song durations keyed by "path|mtime_ns|size"; None marks files that could not be measured
+        self.duration_cache_path = base_dir / DURATION_CACHE_FILENAME
+        self._song_duration_cache: "OrderedDict[str, Optional[float]]" = OrderedDict()
+        self._duration_cache_dirty = False
+        # Durations are probed on the background executor as well as the seek timer thread
+        self._duration_lock = threading.Lock()
+        self._load_duration_cache()
         self.navigation_action = None  # 'next' | 'previous' | 'quit' | None
         self.quit_confirmation_time = 0.0
         self.quit_message_displayed = False
@@ -190,6 +338,10 @@ class MusicPlayer:
         self.current_lyric_candidates = []
         self.current_lyric_choice_index = 0
         self.current_lrc_path = None
+        # Normalized words (and their content-word set) of every LRC stem in songs_dir;
+        # rebuilt when the folder's mtime changes
+        self._lrc_index: Optional[List[Tuple[Path, List[str], FrozenSet[str]]]] = None
+        self._lrc_index_mtime: Optional[int] = None
         # transient header notification (e.g., Displaying: file.lrc)
         self.header_notification = ""
         self.header_notification_until = 0.0
@@ -201,9 +353,32 @@ class MusicPlayer:
         self._input_thread_stop = None
         # One-shot initial resync flag
         self._needs_initial_resync = False
-
-    # Initialize pygame mixer
-    pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=1024)
+        # Background lookup of the next song's lyrics near the end of the current one
+        self._preload_executor = ThreadPoolExecutor(max_workers=1)
+        self._preloaded_next = None  # (song_path, Future[(candidates, first candidate's lyrics)]) or None
+        # Parsed lyrics handed over by the preload, used once by load_lyrics_from_file
+        self._preloaded_lyrics: Optional[Tuple[Path, List[LyricLine]]] = None
+        # Set by the input thread whenever a key changes player state; wakes the display loop
+        self._redraw_event = threading.Event()
+        # Lines currently on screen; only lines that differ are rewritten
+        self._prev_frame: List[str] = []
+        # Lyric window rows, reused by display_lyrics every frame
+        self._lyrics_buf: List[str] = [""] * (WINDOW_BEFORE + WINDOW_AFTER)
+        # Rendered variants of the current precise line keyed by (word index, revealed chars);
+        # cleared whenever the current line changes
+        self._frame_cache: Dict[Tuple[int, int], str] = {}
+        self._frame_cache_line: Optional[LyricLine] = None
+        self._out = sys.stdout
+        # Static display chrome (built once instead of every frame)
+        sep_width = _separator_width()
+        self._sep_eq = f"{_G}{'=' * sep_width}{_RS}"
+        self._sep_dash = f"{_W}{'─' * sep_width}{_RS}"
+        self._now_playing_line = ""
+        self._controls_mid = f"{_C} [SPACE] Pause | [N] Next | [P] Previous | [←/→] Seek | [Q] Quit{_RS}"
+        self._controls_lines = ["", self._sep_dash, self._controls_mid, self._sep_dash]
+        # Info rows other than the clock only change with the key below; rebuilt when it does
+        self._info_key: Optional[tuple] = None
+        self._info_lines: List[str] = []
 
     def _stop_input_thread(self, join: bool = True):
         """Signal the input thread to stop and optionally join it."""
@@ -291,36 +466,51 @@ class MusicPlayer:
                         else:
                             print(f"Warning: Song file not found: {song_path}")
 
-            print(f"Loaded {len(self.playlist)} songs from playlist (lyrics delay: {self.lyric_delay:.2f}s)")
-            return len(self.playlist) > 0
+            self._playlist_len = len(self.playlist)
+            print(f"Loaded {self._playlist_len} songs from playlist (lyrics delay: {self.lyric_delay:.2f}s)")
+            return self._playlist_len > 0
 
         except Exception as e:
             print(f"Error loading playlist: {e}")
             return False
 
-    def find_partial_lyrics_match(self, song_stem: str) -> Optional[Path]:
-        """Find LRC file that partially matches the song name"""
-        if not self.songs_dir.exists():
-            return None
+    def _get_lrc_index(self) -> List[Tuple[Path, List[str], FrozenSet[str]]]:
+        """Return (lrc_path, normalized stem words, content words) for every LRC in songs_dir.
 
-        # Get all LRC files in the songs directory
-        lrc_files = list(self.songs_dir.glob("*.lrc"))
+        Normalizing every stem is the expensive part of a lookup, so the result is
+        kept until songs_dir's mtime changes (a file added, removed or renamed).
+        """
+        try:
+            mtime = os.stat(self.songs_dir).st_mtime_ns
+        except OSError:
+            return []
+
+        index = self._lrc_index
+        if index is None or mtime != self._lrc_index_mtime:
+            index = []
+            for p in self.songs_dir.glob("*.lrc"):
+                words = self.normalize_filename(p.stem).split()
+                index.append((p, words, _content_words(words)))
+            self._lrc_index = index
+            self._lrc_index_mtime = mtime
+        return index
 
-        if not lrc_files:
+    def find_partial_lyrics_match(self, song_stem: str) -> Optional[Path]:
+        """Find LRC file that partially matches the song name"""
+        lrc_index = self._get_lrc_index()
+        if not lrc_index:
             return None
 
         # Normalize the song name for comparison
-        normalized_song = self.normalize_filename(song_stem)
+        song_words = self.normalize_filename(song_stem).split()
+        song_content = _content_words(song_words)
 
         best_match = None
         best_score = 0
 
-        for lrc_file in lrc_files:
-            lrc_stem = lrc_file.stem
-            normalized_lrc = self.normalize_filename(lrc_stem)
-
+        for lrc_file, lrc_words, lrc_content in lrc_index:
             # Calculate match score
-            score = self.calculate_match_score(normalized_song, normalized_lrc)
+            score = self.calculate_match_score(song_words, lrc_words, song_content, lrc_content)
 
             if score > best_score and score >= 0.7:  # Minimum 70% match
                 best_score = score
@@ -333,26 +523,22 @@ class MusicPlayer:
 
         Order: exact match first (if any), then partial matches by score desc.
         """
-        if not self.songs_dir.exists():
+        lrc_index = self._get_lrc_index()
+        if not lrc_index:
             return []
 
-        lrc_files = list(self.songs_dir.glob("*.lrc"))
-        if not lrc_files:
-            return []
-
-        normalized_song = self.normalize_filename(song_stem)
+        song_words = self.normalize_filename(song_stem).split()
+        song_content = _content_words(song_words)
 
         exact_matches: List[Path] = []
         partials: List[Tuple[Path, float]] = []
 
-        for lrc_file in lrc_files:
-            lrc_stem = lrc_file.stem
-            if lrc_stem == song_stem:
+        for lrc_file, lrc_words, lrc_content in lrc_index:
+            if lrc_file.stem == song_stem:
                 exact_matches.append(lrc_file)
                 continue
 
-            normalized_lrc = self.normalize_filename(lrc_stem)
-            score = self.calculate_match_score(normalized_song, normalized_lrc)
+            score = self.calculate_match_score(song_words, lrc_words, song_content, lrc_content)
             if score >= 0.7:
                 partials.append((lrc_file, score))
 
@@ -383,50 +569,53 @@ class MusicPlayer:
 
         # Unify featuring separators before we drop punctuation:
         # examples: "artist _ guest", "artist x guest", "artist ft. guest"
-        normalized = re.sub(r"\s[_xX]\s", " feat ", normalized)
-        normalized = re.sub(r"\b(feat\.?|featuring|ft\.?|with)\b", " feat ", normalized)
+        normalized = _FEAT_SEP_RE.sub(" feat ", normalized)
+        normalized = _FEAT_WORD_RE.sub(" feat ", normalized)
 
         # Replace various separators with space (keep after unifying 'feat')
-        normalized = re.sub(r'[\-\(\)\[\]]', ' ', normalized)
+        normalized = _SEP_RE.sub(' ', normalized)
         # Keep underscore handling last to not lose the above patterning
-        normalized = re.sub(r'_+', ' ', normalized)
+        normalized = _UNDERSCORE_RE.sub(' ', normalized)
 
         # Remove extra information commonly found in LRC files
         # Remove BPM info (e.g., "- 209 -")
-        normalized = re.sub(r'\s*-\s*\d{2,3}\s*-\s*', ' ', normalized)
+        normalized = _BPM_RE.sub(' ', normalized)
 
         # Remove "_qm" suffix or trailing quality markers
-        normalized = re.sub(r'\s*qm\s*$', '', normalized)
+        normalized = _QM_RE.sub('', normalized)
 
         # Remove common release descriptors and editions
-        normalized = re.sub(r'\b(deluxe|remaster(ed)?|explicit|clean|radio|edit|version|main|full|mix|mono|stereo)\b', ' ', normalized)
+        normalized = _EXPLICIT_RE.sub(' ', normalized)
 
         # Keep a single canonical 'feat' token for all variations
-        normalized = re.sub(r'\s*feat[^a-z]*\s*', ' feat ', normalized)
+        normalized = _FEAT_RE.sub(' feat ', normalized)
 
         # Collapse numbers that are likely section markers like "1-main", "2-full" into spaces
-        normalized = re.sub(r'\b\d+\b', ' ', normalized)
+        normalized = _NUM_RE.sub(' ', normalized)
 
         # Normalize multiple spaces to single space
-        normalized = re.sub(r'\s+', ' ', normalized)
+        normalized = _WS_RE.sub(' ', normalized)
 
         return normalized.strip()
 
-    def calculate_match_score(self, song_name: str, lrc_name: str) -> float:
-        """Calculate how well two normalized filenames match"""
-        # Split into words
-        song_words = song_name.split()
-        lrc_words = lrc_name.split()
+    def calculate_match_score(self, song_words: List[str], lrc_words: List[str],
+                              song_content: Optional[FrozenSet[str]] = None,
+                              lrc_content: Optional[FrozenSet[str]] = None) -> float:
+        """Calculate how well two normalized filenames (already split into words) match.
 
+        song_content/lrc_content: precomputed _content_words() of each side, if available.
+        """
         if not song_words or not lrc_words:
             return 0.0
 
-        # A small set of words to ignore for overlap/subsequence comparisons
-        stop = {
-            'feat', 'featuring', 'ft', 'with', 'and', '&',
-            'explicit', 'clean', 'radio', 'edit', 'version', 'deluxe', 'remaster', 'remastered',
-            'main', 'full', 'mix'
-        }
+        # Every score below counts shared words, so names with none in common score 0;
+        # this is the common case when scanning a whole library
+        first_match = song_words[0] == lrc_words[0]
+        if not first_match and set(song_words).isdisjoint(lrc_words):
+            return 0.0
+
+        song_len = len(song_words)
+        lrc_len = len(lrc_words)
 
         def prefix_score() -> float:
             matching = 0
@@ -437,8 +626,8 @@ class MusicPlayer:
                     break
             if matching == 0:
                 return 0.0
-            score = matching / len(song_words)
-            lrc_ratio = matching / max(1, len(lrc_words))
+            score = matching / song_len
+            lrc_ratio = matching / lrc_len
             if lrc_ratio >= 0.5:
                 score += 0.1
             return min(1.0, score)
@@ -448,22 +637,20 @@ class MusicPlayer:
             i = 0
             j = 0
             matched = 0
-            while i < len(song_words) and j < len(lrc_words):
+            while i < song_len and j < lrc_len:
                 if song_words[i] == lrc_words[j]:
                     matched += 1
                     i += 1
                     j += 1
                 else:
                     j += 1
-            return matched / len(song_words)
+            return matched / song_len
 
         def overlap_score() -> float:
-            sw = [w for w in song_words if w not in stop]
-            lw = [w for w in lrc_words if w not in stop]
-            if not sw or not lw:
+            sset = song_content if song_content is not None else _content_words(song_words)
+            lset = lrc_content if lrc_content is not None else _content_words(lrc_words)
+            if not sset or not lset:
                 return 0.0
-            sset = set(sw)
-            lset = set(lw)
             inter = len(sset & lset)
             # Symmetric overlap
             return 0.5 * (inter / len(sset)) + 0.5 * (inter / len(lset))
@@ -476,7 +663,7 @@ class MusicPlayer:
         combined = max(p, oseq, ovlp)
 
         # Small boost if first token (usually the title) matches
-        if song_words and lrc_words and song_words[0] == lrc_words[0]:
+        if first_match:
             combined = min(1.0, combined + 0.1)
 
         return combined
@@ -512,7 +699,11 @@ class MusicPlayer:
 
     def load_lyrics_from_file(self, lrc_path: Path, *, verbose: bool = True) -> List[LyricLine]:
         """Load lyrics from a specific LRC file path."""
-        lyrics = LRCParser.parse_lrc_file(lrc_path)
+        preloaded, self._preloaded_lyrics = self._preloaded_lyrics, None
+        if preloaded is not None and preloaded[0] == lrc_path:
+            lyrics = preloaded[1]
+        else:
+            lyrics = LRCParser.parse_lrc_file(lrc_path)
         if lyrics and verbose:
             precise_count = sum(1 for lyric in lyrics if lyric.is_precise)
             if precise_count > 0:
@@ -521,198 +712,189 @@ class MusicPlayer:
 
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Erase display + cursor home; same ANSI path as render_frame (colorama translates it
+        # on legacy consoles), so no cls/clear subprocess per song
+        self._out.write('\033[2J\033[H')
+        self._out.flush()
 
     def hide_cursor(self):
         """Hide the terminal cursor"""
-        print('\033[?25l', end='', flush=True)
+        self._out.write('\033[?25l')
+        self._out.flush()
 
     def show_message(self, message: str, duration: float = 2.0):
-        """Show a temporary message for a specified duration"""
-        self.move_cursor_home()
-
-        # Display player info (keep the header)
-        info_lines = [
-            f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}",
-            f"{Fore.GREEN}Version: {version} | Author: {author}{Style.RESET_ALL}",
-            f"{Fore.YELLOW}🎵 {message}{Style.RESET_ALL}",
-            f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-            "",
-        ]
-
-        for line in info_lines:
-            self.print_line_clean(line)
+        """Show a temporary message in the header for a specified duration"""
+        # Called from the input thread: hand the message to the display loop through the
+        # header notification instead of drawing it here
+        self.header_notification = f"🎵 {message}"
+        self.header_notification_until = time.monotonic() + duration
+        self.header_notification_color = _Y
+        self._redraw_event.set()
 
     def show_cursor(self):
         """Show the terminal cursor"""
-        print('\033[?25h', end='', flush=True)
-
-    def move_cursor_home(self):
-        """Move cursor to top-left without clearing screen"""
-        print('\033[H', end='', flush=True)
-
-    def clear_current_line(self):
-        """Clear the current line completely"""
-        print('\033[K', end='', flush=True)
-
-    def print_line_clean(self, text: str):
-        """Print a line and clear any remaining characters"""
-        print(text, end='')
-        print('\033[K')  # Clear from cursor to end of line
-
-    def get_current_lyric_index(self) -> int:
-        """Get the index of the current lyric line"""
-        if not self.current_lyrics:
+        self._out.write('\033[?25h')
+        self._out.flush()
+
+    def render_frame(self, frame: List[str]):
+        """Rewrite only the screen lines that changed since the previous frame"""
+        prev = self._prev_frame
+        prefixes = _ROW_PREFIXES
+        n_prefixes = len(prefixes)
+        buf: List[str] = []
+        for i, line in enumerate(frame):
+            if i >= len(prev) or line != prev[i]:
+                # Move to row i+1, clear it and write the new content
+                buf.append(prefixes[i] if i < n_prefixes else f"\033[{i + 1};1H\033[2K")
+                buf.append(line)
+        # Clear leftovers if the frame got shorter
+        for i in range(len(frame), len(prev)):
+            buf.append(prefixes[i] if i < n_prefixes else f"\033[{i + 1};1H\033[2K")
+        if buf:
+            # One write + flush per frame instead of one per line
+            self._out.write("".join(buf))
+            self._out.flush()
+        self._prev_frame = frame
+
+    def set_current_lyrics(self, lyrics: List[LyricLine]):
+        """Replace the active lyrics and rebuild the timestamp index used for lookups"""
+        self._lyric_ts = [lyric.timestamp for lyric in lyrics]
+        self._lyric_cursor = -1
+        self._current_lyrics_duration_estimate = self._compute_lyrics_duration_estimate(lyrics)
+        self._is_precise_track = any(lyric.is_precise for lyric in lyrics)
+        self.current_lyrics = lyrics
+
+    def get_current_lyric_index(self, lyrics_time: Optional[float] = None) -> int:
+        """Get the index of the current lyric line (lyrics_time defaults to get_lyrics_time())"""
+        ts = self._lyric_ts
+        if not ts:
             return -1
-
-        current_time = self.get_lyrics_time()
-        current_index = -1
-        for i, lyric in enumerate(self.current_lyrics):
-            if lyric.timestamp <= current_time:
-                current_index = i
-            else:
+        if lyrics_time is None:
+            lyrics_time = self.get_lyrics_time()
+
+        # Last line whose timestamp <= current time (lyrics are sorted by timestamp).
+        # Playback moves forward, so that is almost always the previous answer or the line
+        # after it; anything else (seeks, lyric switches) falls back to a bisect.
+        n = len(ts)
+        cursor = self._lyric_cursor
+        for index in (cursor, cursor + 1):
+            if (
+                -1 <= index < n
+                and (index < 0 or ts[index] <= lyrics_time)
+                and (index + 1 >= n or lyrics_time < ts[index + 1])
+            ):
                 break
-        return current_index
+        else:
+            index = bisect.bisect_right(ts, lyrics_time) - 1
+        self._lyric_cursor = index
+        return index
 
 
-    def get_lyrics_time(self) -> float:
+    def get_lyrics_time(self, position: Optional[float] = None) -> float:
         """Playback time used for lyrics display/animation (applies Bluetooth delay)."""
-        return max(0.0, self.get_playback_position() - self.lyric_delay)
+        if position is None:
+            position = self.get_playback_position()
+        return max(0.0, position - self.lyric_delay)
 
-    def display_lyrics(self):
-        """Display lyrics with current line highlighted and word-by-word for precise LRC"""
+    def display_lyrics(self, current_time: Optional[float] = None,
+                       reveal: Optional[Tuple[int, int]] = None):
+        """Display lyrics with current line highlighted and word-by-word for precise LRC
+
+        current_time: lyrics time of this frame (see get_lyrics_time); read from the clock if omitted.
+        reveal: _reveal_state of the current line at current_time, if the caller already has it.
+        The returned list is reused on the next call; copy it to keep it.
+        """
         if not self.current_lyrics:
             return []
 
-        # Get current playback position
-        current_time = self.get_lyrics_time()
+        if current_time is None:
+            current_time = self.get_lyrics_time()
 
         # Find current lyric line
-        current_index = -1
-        for i, lyric in enumerate(self.current_lyrics):
-            if lyric.timestamp <= current_time:
-                current_index = i
-            else:
-                break
+        current_index = self.get_current_lyric_index(current_time)
 
-        # Display lyrics window (show 5 lines: 2 before, current, 2 after)
-        window_size = 5
-        start_index = max(0, current_index - 2)
+        # Display lyrics window (show 5 lines: 2 before, current, 2 after); only these get formatted
+        window_size = WINDOW_BEFORE + WINDOW_AFTER
+        start_index = max(0, current_index - WINDOW_BEFORE)
         end_index = min(len(self.current_lyrics), start_index + window_size)
 
         # Adjust start if we're near the end
         if end_index - start_index < window_size and start_index > 0:
             start_index = max(0, end_index - window_size)
 
-        lyrics_display = []
+        lyrics_display = self._lyrics_buf
+        row = 0
         for i in range(start_index, end_index):
             lyric = self.current_lyrics[i]
 
             if i == current_index:
                 # Current line - handle word-by-word highlighting for precise LRC
                 if lyric.is_precise and lyric.words:
-                    # Provide the next line timestamp to refine last-word duration
-                    next_line_timestamp = None
-                    if current_index + 1 < len(self.current_lyrics):
-                        next_line_timestamp = self.current_lyrics[current_index + 1].timestamp
-
-                    line_text = self.format_precise_lyric_line(lyric, current_time, next_line_timestamp)
-                    line = f"♪ {line_text}"
+                    line_text = self.format_precise_lyric_line(lyric, current_time, reveal)
+                    line = _CURRENT_PREFIX + line_text
                 else:
                     # Standard highlighting for non-precise lines - use white instead of background
-                    line = f"{Fore.WHITE}♪ {lyric.text}{Style.RESET_ALL}"
-            elif i == current_index + 1:
-                # Next line - use same color as other lines (cyan)
-                if lyric.is_precise and lyric.words:
-                    # For next line, show clean text without timing highlights
-                    clean_text = self.get_clean_text_from_words(lyric.words)
-                    line = f"{Fore.CYAN}  {clean_text}{Style.RESET_ALL}"
-                else:
-                    line = f"{Fore.CYAN}  {lyric.text}{Style.RESET_ALL}"
+                    line = _CURRENT_PLAIN_PREFIX + lyric.text + _RS
             else:
-                # Other lines
-                if lyric.is_precise and lyric.words:
-                    clean_text = self.get_clean_text_from_words(lyric.words)
-                    line = f"{Fore.CYAN}  {clean_text}{Style.RESET_ALL}"
-                else:
-                    line = f"{Fore.CYAN}  {lyric.text}{Style.RESET_ALL}"
-
-            lyrics_display.append(line)
-
+                # Next and other lines (cyan) never change, so render once and reuse
+                line = lyric._render_cache
+                if line is None:
+                    # Show clean text without timing highlights
+                    line = _OTHER_PREFIX + lyric._clean_text + _RS
+                    lyric._render_cache = line
+
+            lyrics_display[row] = line
+            row += 1
+
+        # Constant height keeps the controls on the same rows for the line-diff renderer
+        for row in range(row, window_size):
+            lyrics_display[row] = ""
         return lyrics_display
 
-    def format_precise_lyric_line(self, lyric: LyricLine, current_time: float, next_line_timestamp: Optional[float] = None) -> str:
+    def format_precise_lyric_line(self, lyric: LyricLine, current_time: float,
+                                  reveal: Optional[Tuple[int, int]] = None) -> str:
         """Format a precise lyric line with smooth color transitions and character-by-character animation.
 
-        Duration of the active word is derived from the timestamp gap to the next word. For the last
-        word in the line, we use either the next line's timestamp (if provided) or fall back to the
-        median gap of the line (and finally a small default) to keep animation smooth.
+        Duration of the active word comes from the per-word durations precomputed at parse time
+        (see LyricLine.set_word_durations). reveal is the line's (word index, revealed chars) at
+        current_time; looked up here if omitted.
         """
         if not lyric.words:
-            return f"{Fore.WHITE}{lyric.text}{Style.RESET_ALL}"
+            return f"{_W}{lyric.text}{_RS}"
 
-        formatted_parts: List[str] = []
-        current_word_index = -1
+        if reveal is None:
+            reveal = self._line_reveal_state(lyric, current_time)
+        current_word_index = reveal[0]
 
-        # Find the current word being sung
-        for i, word in enumerate(lyric.words):
-            if word.timestamp <= current_time:
-                current_word_index = i
-            else:
-                break
+        # The rendered line only changes when the active word or its revealed character count does
+        if lyric is not self._frame_cache_line:
+            self._frame_cache.clear()
+            self._frame_cache_line = lyric
+        key = reveal
+        cached = self._frame_cache.get(key)
+        if cached is not None:
+            return cached
+
+        formatted_parts: List[str] = []
 
         # Format each word with smooth transitions
         for i, word in enumerate(lyric.words):
             if i < current_word_index:
                 # Already sung words - white
-                formatted_parts.append(f"{Fore.WHITE}{word.text}{Style.RESET_ALL}")
+                formatted_parts.append(word._sung)
             elif i == current_word_index:
                 # Currently singing word - animate character by character
-                # Compute dynamic duration using the gap to the next word; clamp to reasonable bounds
-                # to avoid flicker (too small) or sluggishness (too large).
                 # min_dur, max_dur = 0.05, 2.5
-                # Prefer explicit end timestamp when available
-                if word.end_timestamp is not None:
-                    raw_duration = max(0.0, word.end_timestamp - word.timestamp)
-                elif i + 1 < len(lyric.words):
-                    raw_duration = max(0.0, lyric.words[i + 1].timestamp - word.timestamp)
-                else:
-                    # Last word: use next line start if provided, otherwise median inter-word gap or default
-                    if next_line_timestamp is not None:
-                        raw_duration = max(0.0, next_line_timestamp - word.timestamp)
-                    else:
-                        gaps = [
-                            max(0.0, lyric.words[j + 1].timestamp - lyric.words[j].timestamp)
-                            for j in range(len(lyric.words) - 1)
-                        ]
-                        if gaps:
-                            sorted_gaps = sorted(gaps)
-                            mid = len(sorted_gaps) // 2
-                            raw_duration = (
-                                sorted_gaps[mid]
-                                if len(sorted_gaps) % 2 == 1
-                                else (sorted_gaps[mid - 1] + sorted_gaps[mid]) / 2.0
-                            )
-                        else:
-                            raw_duration = 0.5
-
                 # duration = max(min_dur, min(max_dur, raw_duration if raw_duration > 0 else 0.5))
-                duration = raw_duration if raw_duration > 0 else 0.5
-                animated_word = self.animate_word_reveal(word, current_time, duration)
+                animated_word = self.animate_word_reveal(word, current_time, lyric._word_durations[i])
                 formatted_parts.append(animated_word)
             else:
                 # Future words - blue
-                formatted_parts.append(f"{Fore.BLUE}{word.text}{Style.RESET_ALL}")
+                formatted_parts.append(word._unsung)
 
-        return "".join(formatted_parts)
+        line_text = "".join(formatted_parts)
+        self._frame_cache[key] = line_text
+        return line_text
 
     def animate_word_reveal(self, word: LyricWord, current_time: float, duration: Optional[float] = None) -> str:
         """Create character-by-character reveal animation for current word.
@@ -743,8 +925,8 @@ class MusicPlayer:
         # chars_to_reveal = min(len(word.text),int((current_time - word.timestamp) / time_per_char) + 1)
 
         # # Ver 3.0: Reveal one character at a time with a small delay before starting
-        time_per_char = word_duration / max(1, len(word.text))
-        elapsed = current_time - word.timestamp
+        # time_per_char = word_duration / max(1, len(word.text))
+        # elapsed = current_time - word.timestamp
         # REVEAL_SPSION = 0.05
         # if elapsed < 0:
         #     chars_to_reveal = 0
@@ -755,32 +937,57 @@ class MusicPlayer:
         # chars_to_reveal = max(0, min(len(word.text), chars_to_reveal))
 
         # Ver: 4.0: Use a ratio.
-        ratio = temp_ratio
-        chars_to_reveal = math.floor(elapsed / time_per_char - ratio) + 1
-        chars_to_reveal = max(0, min(len(word.text), chars_to_reveal))
+        # ratio = temp_ratio
+        # chars_to_reveal = math.floor(elapsed / time_per_char - ratio) + 1
+        # chars_to_reveal = max(0, min(len(word.text), chars_to_reveal))
+
+        # Ver 4.1: same ratio rule, with the per-character thresholds precomputed once per word
+        chars_to_reveal = bisect.bisect_right(word.reveal_times(word_duration), current_time)
 
 
-        # Split the word into revealed and unrevealed parts
-        revealed_part = word.text[:chars_to_reveal]
-        unrevealed_part = word.text[chars_to_reveal:]
+        # Revealed part in white, the rest in blue; every split is rendered once per word
+        reveal_cache = word._reveal_cache
+        if reveal_cache is None:
+            text = word.text
+            reveal_cache = [f"{_W}{text[:k]}{_RS}{_B}{text[k:]}{_RS}" for k in range(len(text) + 1)]
+            word._reveal_cache = reveal_cache
 
-        # Create the animated display
-        animated_text = f"{Fore.WHITE}{revealed_part}{Style.RESET_ALL}{Fore.BLUE}{unrevealed_part}{Style.RESET_ALL}"
+        return reveal_cache[chars_to_reveal]
 
-        return animated_text
+    def _update_clock(self, *, time_base: Optional[float] = None, paused_pos: Optional[float] = None,
+                      is_paused: Optional[bool] = None):
+        """Publish a clock change so lock-free readers never see a half-applied update.
 
-    def get_clean_text_from_words(self, words: List[LyricWord]) -> str:
-        """Extract clean text from word list for display"""
-        return "".join(word.text for word in words)
+        Writers are rare (play/pause/seek/resync) and serialize on the audio lock; the
+        sequence counter is odd while fields are being written.
+        """
+        with self._audio_lock:
+            self._clock_seq += 1
+            if time_base is not None:
+                self._time_base = time_base
+            if paused_pos is not None:
+                self._paused_pos = paused_pos
+            if is_paused is not None:
+                self.is_paused = is_paused
+            self._clock_seq += 1
 
     def get_playback_position(self) -> float:
         """Get current playback position in seconds"""
-        if self.is_paused:
-            # When paused, return the time at which we paused
-            return max(0, self.pause_start_time - self.start_time - self.total_pause_time + self.seek_offset)
-        else:
-            # When playing, return current time minus start time and total pause time plus seek offset
-            return max(0, time.time() - self.start_time - self.total_pause_time + self.seek_offset)
+        # Seqlock read: retry if a writer was active or finished while we read
+        while True:
+            seq = self._clock_seq
+            if seq & 1:
+                continue
+            paused = self.is_paused
+            time_base = self._time_base
+            paused_pos = self._paused_pos
+            if self._clock_seq == seq:
+                break
+        if paused:
+            # When paused, return the position at which we paused
+            return paused_pos
+        # Monotonic clock is immune to wall-clock adjustments during long sessions
+        return max(0.0, time.monotonic() - time_base)
 
     def _get_current_song(self) -> Optional[Path]:
         if 0 <= self.current_song_index < len(self.playlist):
@@ -788,49 +995,127 @@ class MusicPlayer:
         return None
 
     def _estimate_duration_from_lyrics(self) -> Optional[float]:
-        # Fallback: use last precise timestamp or last line timestamp if available
-        if not self.current_lyrics:
+        # Fallback: computed once per lyric set in set_current_lyrics
+        return self._current_lyrics_duration_estimate
+
+    @staticmethod
+    def _compute_lyrics_duration_estimate(lyrics: List[LyricLine]) -> Optional[float]:
+        # Use last precise timestamp or last line timestamp if available
+        if not lyrics:
             return None
+        last_ts = max((line.words[-1].timestamp if line.is_precise and line.words else line.timestamp)
+                      for line in lyrics)
+        # Add small tail to approximate track end beyond last lyric
+        return max(0.0, last_ts + 3.0)
+
+    def _load_duration_cache(self):
+        """Load persisted song durations from the previous runs (best-effort)."""
         try:
-            last_ts = max((line.words[-1].timestamp if line.is_precise and line.words else line.timestamp)
-                          for line in self.current_lyrics)
-            # Add small tail to approximate track end beyond last lyric
-            return max(0.0, last_ts + 3.0)
-        except Exception:
-            return None
+            with open(self.duration_cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                # Saved oldest-first, so keeping the tail keeps the most recently used
+                self._song_duration_cache = OrderedDict(list(data.items())[-DURATION_CACHE_MAX:])
+        except (OSError, ValueError):
+            pass
 
-    def get_song_duration(self, song_path: Path) -> Optional[float]:
-        """Return song duration in seconds if determinable; caches per path."""
+    def _save_duration_cache(self):
+        """Write the duration cache back to disk if new entries were measured."""
+        if not self._duration_cache_dirty:
+            return
+        with self._duration_lock:
+            data = dict(self._song_duration_cache)
+            self._duration_cache_dirty = False
         try:
-            if song_path in self._song_duration_cache:
-                return self._song_duration_cache[song_path]
+            with open(self.duration_cache_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+        except OSError:
+            self._duration_cache_dirty = True
+
+    @staticmethod
+    def _duration_cache_key(song_path: Path) -> str:
+        st = song_path.stat()
+        return f"{song_path}|{st.st_mtime_ns}|{st.st_size}"
 
-            # Try using pygame Sound (may not support all formats; can be memory heavy for very large files)
-            duration = None
+    @staticmethod
+    def _read_audio_duration(song_path: Path) -> Optional[float]:
+        """Read the audio length, preferring mutagen's header-only parse over a full decode."""
+        if MutagenFile is not None:
             try:
-                snd = pygame.mixer.Sound(str(song_path))
-                duration = float(snd.get_length())
+                audio = MutagenFile(str(song_path))
+                if audio is not None and audio.info is not None:
+                    return float(audio.info.length)
             except Exception:
-                duration = None
+                pass
+        # Try using pygame Sound (may not support all formats; can be memory heavy for very large files)
+        try:
+            snd = pygame.mixer.Sound(str(song_path))
+            return float(snd.get_length())
+        except Exception:
+            return None
 
-            if duration is None or duration <= 0:
-                duration = self._estimate_duration_from_lyrics()
+    def get_song_duration(self, song_path: Path) -> Optional[float]:
+        """Return song duration in seconds if determinable, falling back to the lyrics estimate."""
+        duration = self._probe_song_duration(song_path)
+        if duration is None:
+            # Not cached: the estimate depends on the currently loaded lyrics
+            duration = self._estimate_duration_from_lyrics()
+        return duration
+
+    def _probe_song_duration(self, song_path: Path) -> Optional[float]:
+        """Measured song duration in seconds, or None; caches per file path + mtime + size."""
+        try:
+            key = self._duration_cache_key(song_path)
+        except OSError:
+            return None
 
-            if duration is not None and duration > 0:
-                self._song_duration_cache[song_path] = duration
-                return duration
-        except Exception:
-            pass
-        return None
+        cache = self._song_duration_cache
+        with self._duration_lock:
+            cached = key in cache
+            if cached:
+                cache.move_to_end(key)
+                duration = cache[key]
+        if not cached:
+            # Probe outside the lock; this may read the file header or even decode it
+            duration = self._read_audio_duration(song_path)
+            if duration is not None and duration <= 0:
+                duration = None
+            with self._duration_lock:
+                # Remember failures too, so unreadable files are not decoded again
+                cache[key] = duration
+                if len(cache) > DURATION_CACHE_MAX:
+                    cache.popitem(last=False)
+                self._duration_cache_dirty = True
+        return duration
 
     def seek_audio(self, delta_seconds: float):
-        """Seek by delta seconds with clamping [0, duration-2], robust against rapid taps and modifiers."""
+        """Queue a seek by delta seconds; rapid taps are summed into one seek after a short pause."""
+        with self._audio_lock:
+            self._pending_seek_delta += float(delta_seconds)
+            # Restart the quiet-period timer on every tap
+            if self._seek_timer is not None:
+                self._seek_timer.cancel()
+            self._seek_timer = threading.Timer(self._min_seek_interval, self._commit_seek)
+            self._seek_timer.daemon = True
+            self._seek_timer.start()
+
+    def _cancel_pending_seek(self):
+        """Drop any queued seek (e.g. when the song changes)."""
+        with self._audio_lock:
+            if self._seek_timer is not None:
+                self._seek_timer.cancel()
+                self._seek_timer = None
+            self._pending_seek_delta = 0.0
+
+    def _commit_seek(self):
+        """Seek by the accumulated delta with clamping [0, duration-2]."""
         with self._audio_lock:
-            now = time.time()
-            if (now - self._last_seek_at) < self._min_seek_interval:
-                # debounce rapid repeated seeks
+            delta_seconds = self._pending_seek_delta
+            self._pending_seek_delta = 0.0
+            self._seek_timer = None
+            if not self.is_playing or delta_seconds == 0:
                 return
-            self._last_seek_at = now
+            self._last_seek_at = time.monotonic()
 
             current_song = self._get_current_song()
             if not current_song:
@@ -846,7 +1131,7 @@ class MusicPlayer:
             if duration is not None and duration > 0:
                 max_pos = max(0.0, duration - 2.0)  # guard 2s before end
 
-            target_pos = current_pos + float(delta_seconds)
+            target_pos = current_pos + delta_seconds
             if target_pos < min_pos:
                 target_pos = min_pos
             if max_pos is not None and target_pos > max_pos:
@@ -858,68 +1143,81 @@ class MusicPlayer:
 
             was_paused = self.is_paused
             try:
-                # Restart playback from target position
-                pygame.mixer.music.stop()
-                pygame.mixer.music.load(str(current_song))
-                # pygame's start parameter is in seconds for OGG/MP3; may vary by codec but works for our set
-                pygame.mixer.music.play(start=target_pos)
-
-                # Reset timing references against new start
-                now2 = time.time()
-                self.start_time = now2 - target_pos
-                # zero pause accumulator since we realigned to absolute timeline
-                self.total_pause_time = 0
-                self.seek_offset = 0
-
-                if was_paused:
-                    # Re-apply pause state accurately
-                    self.pause_start_time = now2
-                    pygame.mixer.music.pause()
+                try:
+                    # Seek in place without reloading the file (absolute seconds for our formats)
+                    pygame.mixer.music.set_pos(target_pos)
+                except Exception:
+                    # Codec can't seek in place: restart playback from target position,
+                    # reusing the loaded stream unless a different file is loaded
+                    if self._loaded_path != current_song:
+                        pygame.mixer.music.stop()
+                        pygame.mixer.music.load(str(current_song))
+                        self._loaded_path = current_song
+                    # pygame's start parameter is in seconds for OGG/MP3; may vary by codec but works for our set
+                    pygame.mixer.music.play(start=target_pos)
+                    if was_paused:
+                        # Re-apply pause state accurately
+                        pygame.mixer.music.pause()
+
+                # Reset timing references against new start (paused position too, if paused)
+                self._update_clock(time_base=time.monotonic() - target_pos,
+                                   paused_pos=target_pos if was_paused else None)
+                # get_pos() keeps counting across set_pos(); remember where it maps to
+                self._play_start_pos = target_pos - max(0, pygame.mixer.music.get_pos()) / 1000.0
             except Exception as e:
                 print(f"Error seeking: {e}")
                 # best-effort: do not alter timing further
                 return
+            self._redraw_event.set()
 
     def _resync_clock_to_audio(self):
-        """Align our start_time to the mixer clock (fixes startup buffering latency)."""
+        """Align our clock base to the mixer clock (fixes startup buffering latency)."""
         try:
             pos_ms = pygame.mixer.music.get_pos()
             if pos_ms >= 0:
-                now = time.time()
-                # Align wall-clock start so get_playback_position == mixer position
-                self.start_time = now - (pos_ms / 1000.0)
-                # We realign the absolute clock; keep pause/seek accumulators clean
-                # since we just started the track.
-                self.total_pause_time = 0.0
-                self.seek_offset = 0.0
+                # Align the clock base so get_playback_position == mixer position
+                self._update_clock(time_base=time.monotonic() - (pos_ms / 1000.0))
                 self._needs_initial_resync = False
         except Exception:
             # Best-effort only
             self._needs_initial_resync = False
 
-    def display_player_info(self, song_path: Path):
-        """Display current song info and controls"""
-        song_name = song_path.stem
+    def _track_audio_clock(self, now: float):
+        """Nudge the clock base toward the mixer position about once a second.
+
+        A small low-pass step (delay-locked loop) keeps long tracks from drifting against the
+        audio without visible jumps in the lyrics.
+        """
+        if self.is_paused or self._needs_initial_resync or now - self._last_clock_sync < 1.0:
+            return
+        self._last_clock_sync = now
+        if now - self._last_seek_at < 0.5:
+            # Mixer position is unreliable right after a seek restart
+            return
+        # Hold the audio lock so a concurrent seek's new base is not overwritten
+        with self._audio_lock:
+            try:
+                pos_ms = pygame.mixer.music.get_pos()
+            except Exception:
+                return
+            if pos_ms < 0 or self.is_paused:
+                # Stream ended or not playing
+                return
+            # Fresh clock read: pair it with the mixer sample, not with the frame time
+            measured_base = time.monotonic() - (self._play_start_pos + pos_ms / 1000.0)
+            self._update_clock(time_base=self._time_base + 0.05 * (measured_base - self._time_base))
 
-        # Get playback time
-        current_time = self.get_playback_position()
+    def display_player_info(self, song_path: Path, now: float, current_time: float):
+        """Display current song info and controls (now: time.monotonic() of this frame,
+        current_time: playback position of this frame)"""
         current_min = int(current_time // 60)
         current_sec = current_time % 60
 
-        status = "⏸️  PAUSED " if self.is_paused else "▶️  PLAYING"
-
-        # Determine header line: temporary notification if active
-        now = time.time()
-        if self.header_notification and now < self.header_notification_until:
-            color = self.header_notification_color or Fore.GREEN
-            header_line = f"{color}{self.header_notification}{Style.RESET_ALL}"
-        else:
-            header_line = f"{Fore.GREEN}Version: {version} | Author: {author}{Style.RESET_ALL}"
-            # Clear expired notification
-            if self.header_notification and now >= self.header_notification_until:
-                self.header_notification = ""
-                self.header_notification_until = 0.0
-                self.header_notification_color = None
+        # Clear expired notification
+        if self.header_notification and now >= self.header_notification_until:
+            self.header_notification = ""
+            self.header_notification_until = 0.0
+            self.header_notification_color = None
 
         # LRC position indicator
         if self.current_lyric_candidates:
@@ -932,88 +1230,206 @@ class MusicPlayer:
             lrc_pos = 0
             lrc_total = 0
 
-        info_lines = [
-            f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}",
-            header_line,
-            f"{Fore.YELLOW}🎵 Now Playing: {song_name}{Style.RESET_ALL}",
-            f"{Fore.MAGENTA}{status} |{Fore.BLUE}📀 {self.current_song_index + 1} of {len(self.playlist)} | LRC {lrc_pos} of {lrc_total} | Time: {current_min:02d}:{current_sec:05.2f}{Style.RESET_ALL}",
-            f"{Fore.GREEN}{'='*60}{Style.RESET_ALL}",
-            "",
-        ]
-
+        key = (
+            self.is_paused,
+            self.header_notification,
+            self.header_notification_color,
+            self._now_playing_line,
+            self.current_song_index,
+            lrc_pos,
+            lrc_total,
+        )
+        info_lines = self._info_lines
+        if key != self._info_key:
+            status = "⏸️  PAUSED " if self.is_paused else "▶️  PLAYING"
+
+            # Determine header line: temporary notification if active
+            if self.header_notification:
+                color = self.header_notification_color or _G
+                header_line = f"{color}{self.header_notification}{_RS}"
+            else:
+                header_line = f"{_G}Version: {version} | Author: {author}{_RS}"
+
+            info_lines = [
+                self._sep_eq,
+                header_line,
+                self._now_playing_line,
+                f"{_M}{status} |{_B}📀 {self.current_song_index + 1} of {self._playlist_len} | LRC {lrc_pos} of {lrc_total}{_RS}",
+                "",  # time, filled in below
+                self._sep_eq,
+                "",
+            ]
+            self._info_lines = info_lines
+            self._info_key = key
+
+        # Time on its own line so a running clock only rewrites this one row
+        info_lines[4] = f"{_B}⏱️  Time: {current_min:02d}:{current_sec:05.2f}{_RS}"
         return info_lines
 
-    def display_controls(self):
-        """Display control instructions"""
-        # Check if we should show quit confirmation message
-        # Reset confirmation if expired
-        if self.quit_confirmation_time > 0 and time.time() - self.quit_confirmation_time > 3.0:
-            self.quit_confirmation_time = 0
-            self.quit_message_displayed = False
-
-        # Normal controls display
-        controls = [
-            "",
-            f"{Fore.WHITE}{'─'*60}{Style.RESET_ALL}",
-            f"{Fore.CYAN} [SPACE] Pause | [N] Next | [P] Previous | [←/→] Seek | [Q] Quit{Style.RESET_ALL}",
-            f"{Fore.WHITE}{'─'*60}{Style.RESET_ALL}",
-        ]
-        return controls
+    def _next_frame_timeout(self, current_index: int, lyrics_time: float, now: float,
+                            reveal: Optional[Tuple[int, int]]) -> float:
+        """How long the display loop may sleep before the picture needs to change
+        (reveal: _reveal_state of the current line at lyrics_time)."""
+        if self.is_paused:
+            # Nothing moves while paused and every key sets _redraw_event; only wake up
+            # to expire the quit confirmation / header notification
+            timeout = 1.0
+            if self.quit_confirmation_time > 0:
+                timeout = min(timeout, self.quit_confirmation_time + 3.0 - now)
+            if self.header_notification:
+                timeout = min(timeout, self.header_notification_until - now)
+            return max(0.01, timeout)
+        if not self.current_lyrics:
+            return 0.2
+
+        # Wake for the next visible lyric change: the next revealed character or word of a
+        # precise line, else the next line. Between those only the clock row moves.
+        next_event = self._next_reveal_time(current_index, reveal)
+        if next_event is not None:
+            # Clock ticks at 100ms on precise tracks
+            tick = 0.1
+        else:
+            # Plain LRC: nothing animates, only the clock and line changes need a redraw
+            tick = 0.25 if not self._is_precise_track else 0.2
+            if current_index + 1 < len(self.current_lyrics):
+                next_event = self.current_lyrics[current_index + 1].timestamp
+        if next_event is not None:
+            tick = min(tick, next_event - lyrics_time)
+        return max(MIN_FRAME_INTERVAL, tick)
+
+    def _reveal_state(self, current_index: int, lyrics_time: float) -> Optional[Tuple[int, int]]:
+        """(word index, revealed chars) of the current precise line, or None for other lines."""
+        if not 0 <= current_index < len(self.current_lyrics):
+            return None
+        lyric = self.current_lyrics[current_index]
+        if not lyric.words:
+            return None
+        return self._line_reveal_state(lyric, lyrics_time)
+
+    @staticmethod
+    def _line_reveal_state(lyric: LyricLine, lyrics_time: float) -> Tuple[int, int]:
+        """(word index, revealed chars) of a precise line; word index is -1 before its first word."""
+        if lyric._word_durations is None:
+            lyric.set_word_durations()
+        # Last word whose timestamp <= lyrics time
+        word_index = bisect.bisect_right(lyric._word_ts, lyrics_time) - 1
+        if word_index < 0:
+            return (word_index, 0)
+        reveal_times = lyric.words[word_index].reveal_times(lyric._word_durations[word_index])
+        return (word_index, bisect.bisect_right(reveal_times, lyrics_time))
+
+    def _next_reveal_time(self, current_index: int, reveal: Optional[Tuple[int, int]]) -> Optional[float]:
+        """Lyrics time at which the current precise line next changes (a character or word is
+        revealed), or None when it is fully revealed or the line is not precise.
+
+        reveal: _reveal_state of the current line."""
+        if reveal is None:
+            return None
+        word_index, chars = reveal
+        lyric = self.current_lyrics[current_index]
+        if word_index < 0:
+            return lyric._word_ts[0]
+        reveal_times = lyric.words[word_index].reveal_times(lyric._word_durations[word_index])
+        if chars < len(reveal_times):
+            return reveal_times[chars]
+        if word_index + 1 < len(lyric.words):
+            return lyric._word_ts[word_index + 1]
+        return None
+
+    def _preload_next_song(self):
+        """Start finding lyric candidates for the next playlist entry (once per song)."""
+        if self._preloaded_next is not None:
+            return
+        next_index = self.current_song_index + 1
+        if next_index >= len(self.playlist):
+            return
+        next_path = self.playlist[next_index]
+        future = self._preload_executor.submit(self._find_and_parse_lyrics, next_path.stem)
+        self._preloaded_next = (next_path, future)
+
+    def _find_and_parse_lyrics(self, song_stem: str) -> Tuple[List[Path], Optional[List[LyricLine]]]:
+        """Background half of the preload: lyric candidates plus the parsed first candidate."""
+        candidates = self.find_all_lyrics_matches(song_stem)
+        lyrics = LRCParser.parse_lrc_file(candidates[0]) if candidates else None
+        return candidates, lyrics
+
+    def _take_preloaded_candidates(self, song_path: Path) -> List[Path]:
+        """Lyric candidates for song_path, from the preload when it matches, else looked up now.
+
+        A preloaded parse of the first candidate is kept for load_lyrics_from_file.
+        """
+        preloaded, self._preloaded_next = self._preloaded_next, None
+        self._preloaded_lyrics = None
+        if preloaded is not None and preloaded[0] == song_path:
+            try:
+                candidates, lyrics = preloaded[1].result()
+                if candidates and lyrics is not None:
+                    self._preloaded_lyrics = (candidates[0], lyrics)
+                return candidates
+            except Exception:
+                pass
+        return self.find_all_lyrics_matches(song_path.stem)
 
     def play_song(self, song_path: Path):
         """Play a single song with lyrics display"""
         try:
             print(f"Loading: {song_path.name}")
+            # The song name does not change while it plays; format its line once
+            self._now_playing_line = f"{_Y}🎵 Now Playing: {song_path.stem}{_RS}"
 
             # Load the song
             pygame.mixer.music.load(str(song_path))
+            self._loaded_path = song_path
 
-            # Discover all matching lyrics and load the initial one
-            self.current_lyric_candidates = self.find_all_lyrics_matches(song_path.stem)
+            # Discover all matching lyrics (reusing a background preload if it was for this song)
+            # and load the initial one
+            self.current_lyric_candidates = self._take_preloaded_candidates(song_path)
             self.current_lyric_choice_index = 0
             if self.current_lyric_candidates:
                 self.current_lrc_path = self.current_lyric_candidates[self.current_lyric_choice_index]
-                self.current_lyrics = self.load_lyrics_from_file(self.current_lrc_path, verbose=True)
+                self.set_current_lyrics(self.load_lyrics_from_file(self.current_lrc_path, verbose=True))
                 # show header notification for 3 seconds
                 try:
                     self.header_notification = f"Displaying: {self.current_lrc_path.name}"
-                    self.header_notification_until = time.time() + 3.0
-                    self.header_notification_color = Fore.GREEN
+                    self.header_notification_until = time.monotonic() + 3.0
+                    self.header_notification_color = _G
                 except Exception:
                     pass
             else:
                 # Fallback to legacy behavior (may find one via custom logic)
-                self.current_lyrics = self.load_lyrics(song_path)
+                self.set_current_lyrics(self.load_lyrics(song_path))
             print(f"Loaded {len(self.current_lyrics)} lyric lines")
 
             # Start playing
             pygame.mixer.music.play()
             self.is_playing = True
-            self.is_paused = False
-            self.start_time = time.time()
-            self.total_pause_time = 0
-            self.seek_offset = 0  # Reset seek offset for new song
+            # Position 0 for the new song
+            self._update_clock(time_base=time.monotonic(), paused_pos=0.0, is_paused=False)
+            self._play_start_pos = 0.0
             # Request a one-shot resync once mixer position becomes available
             self._needs_initial_resync = True
-            # prime duration cache for clamping
-            try:
-                _ = self.get_song_duration(song_path)
-            except Exception:
-                pass
+            # Probe the duration in the background so the first frame isn't held up by it;
+            # it only drives the next-song preload and the end check, and seeks measure it
+            # themselves if needed
+            song_duration = None
+            probed_duration = None
+            duration_future = self._preload_executor.submit(self._probe_song_duration, song_path)
 
             # Initial display setup
             self.clear_screen()
+            self._prev_frame = []
             self.hide_cursor()  # Hide cursor for clean display
-            last_lyric_index = -1
-            last_pause_state = False
-            last_display_time = 0
+            last_frame_sig = None
+            force_redraw = True
+            self._redraw_event.clear()
 
             # Start input handler thread AFTER is_playing is True
             self._start_input_thread()
 
             # Main display loop
             while self.is_playing:
-                current_time = time.time()
+                # One clock read per iteration keeps every part of the frame consistent
+                now = time.monotonic()
 
                 # One-shot resync early in playback (when mixer has a real position)
                 if self._needs_initial_resync and not self.is_paused:
@@ -1021,61 +1437,166 @@ class MusicPlayer:
                     # Typically > 0 once playback actually starts
                     if pos_ms >= 0:
                         self._resync_clock_to_audio()
+                else:
+                    self._track_audio_clock(now)
 
-                current_lyric_index = self.get_current_lyric_index()
+                # Playback position and lyrics time are read once and shared by the whole frame
+                position = self.get_playback_position()
+                lyrics_time = self.get_lyrics_time(position)
+                current_lyric_index = self.get_current_lyric_index(lyrics_time)
+                # Word/character reveal of the current line, shared by signature, render and sleep
+                reveal = self._reveal_state(current_lyric_index, lyrics_time)
 
-                # Update display more frequently for smooth animation and quit confirmation
-                should_update = (
-                    current_lyric_index != last_lyric_index or
-                    self.is_paused != last_pause_state or
-                    current_time - last_display_time > 0.05 or  # Update every 50ms for smooth animation
-                    self.quit_confirmation_time > 0  # Update when quit confirmation is active
+                if duration_future is not None and duration_future.done():
+                    try:
+                        probed_duration = duration_future.result()
+                    except Exception:
+                        probed_duration = None
+                    duration_future = None
+                    song_duration = probed_duration
+                    if song_duration is None:
+                        song_duration = self._estimate_duration_from_lyrics()
+
+                # Look up the next song's lyrics during the last 10 seconds of this one
+                if song_duration is not None and position >= song_duration - 10:
+                    self._preload_next_song()
+
+                # Quit confirmation lasts 3 seconds
+                quit_pending = self.quit_confirmation_time > 0
+                if quit_pending and now - self.quit_confirmation_time > 3.0:
+                    self.quit_confirmation_time = 0
+                    self.quit_message_displayed = False
+                    quit_pending = False
+
+                # Cheap fingerprint of everything the frame shows; skip rendering when unchanged
+                frame_sig = (
+                    current_lyric_index,
+                    # Word animation step, so a revealed character shows on the next 50ms tick
+                    reveal,
+                    # Clock at 100ms resolution; 250ms on plain LRC tracks
+                    int(position * 10) if self._is_precise_track else int(position * 4),
+                    self.is_paused,
+                    # Active until it expires, so expiry itself triggers the redraw that clears it
+                    quit_pending,
+                    self.current_lyric_choice_index,
+                    bool(self.header_notification) and now < self.header_notification_until,
                 )
+                should_update = force_redraw or frame_sig != last_frame_sig
 
                 if should_update:
-                    self.move_cursor_home()
-
                     # Display player info
-                    info_lines = self.display_player_info(song_path)
-                    for line in info_lines:
-                        self.print_line_clean(line)
+                    info_lines = self.display_player_info(song_path, now, position)
 
                     # Display lyrics
                     if self.current_lyrics:
-                        lyrics_lines = self.display_lyrics()
-                        for line in lyrics_lines:
-                            self.print_line_clean(line)
+                        lyrics_lines = self.display_lyrics(lyrics_time, reveal)
                     else:
-                        self.print_line_clean(f"{Fore.YELLOW}  No lyrics found for this song{Style.RESET_ALL}")
+                        lyrics_lines = _NO_LYRICS_LINES
 
-                    # Display controls
-                    control_lines = self.display_controls()
-                    for line in control_lines:
-                        self.print_line_clean(line)
+                    # Controls footer is static (quit confirmation shows in the header)
+                    self.render_frame([*info_lines, *lyrics_lines, *self._controls_lines])
 
-                    # Update tracking variables
-                    last_lyric_index = current_lyric_index
-                    last_pause_state = self.is_paused
-                    last_display_time = current_time
+                    last_frame_sig = frame_sig
 
-                # Check if song finished
+                # Check if song finished; with a measured duration, only ask the mixer near the
+                # end (a lyrics estimate may run past the real audio, so it never gates this)
                 if (
                     not self.is_paused
+                    and (probed_duration is None or position >= probed_duration - 2.0)
                     and not pygame.mixer.music.get_busy()
-                    and (time.time() - self._last_seek_at) > 0.5  # ignore brief gap right after seek
+                    and (now - self._last_seek_at) > 0.5  # ignore brief gap right after seek
                 ):
                     self.is_playing = False  # Mark as finished naturally
                     break
 
-                time.sleep(0.05)  # Check every 50ms for smooth animation
+                # Sleep until the next lyric/animation tick, or until a key changes state
+                force_redraw = self._redraw_event.wait(timeout=self._next_frame_timeout(current_lyric_index, lyrics_time, now, reveal))
+                self._redraw_event.clear()
 
         except Exception as e:
             print(f"Error playing {song_path.name}: {e}")
         finally:
             # Ensure input thread for this song is stopped before returning
             self._stop_input_thread(join=True)
+            self._cancel_pending_seek()
+            # Flush newly measured durations once per song rather than on every lookup
+            self._save_duration_cache()
             self.show_cursor()  # Always restore cursor when done
 
+    def _toggle_pause(self):
+        """Space bar - pause/resume"""
+        if self.is_paused:
+            pygame.mixer.music.unpause()
+            # Resume from the frozen position
+            self._update_clock(time_base=time.monotonic() - self._paused_pos, is_paused=False)
+        else:
+            pygame.mixer.music.pause()
+            self._update_clock(paused_pos=self.get_playback_position(), is_paused=True)
+
+    def _next_song(self):
+        if self.current_song_index >= len(self.playlist) - 1:
+            self.show_message("Reached bottom")
+        else:
+            self.navigation_action = 'next'
+            self.is_playing = False
+            pygame.mixer.music.stop()
+
+    def _previous_song(self):
+        if self.current_song_index <= 0:
+            self.show_message("Reached top")
+        else:
+            self.navigation_action = 'previous'
+            self.is_playing = False
+            pygame.mixer.music.stop()
+
+    def _switch_lyrics(self):
+        """Switch to next lyrics file (cycle)"""
+        try:
+            if self.current_lyric_candidates:
+                self.current_lyric_choice_index = (
+                    (self.current_lyric_choice_index + 1) % len(self.current_lyric_candidates)
+                )
+                new_path = self.current_lyric_candidates[self.current_lyric_choice_index]
+                new_lyrics = self.load_lyrics_from_file(new_path, verbose=False)
+                if new_lyrics:
+                    self.set_current_lyrics(new_lyrics)
+                    self.current_lrc_path = new_path
+                    # header notification for 3 seconds
+                    self.header_notification = f"Displaying: {new_path.name}"
+                    self.header_notification_until = time.monotonic() + 3.0
+                    self.header_notification_color = _G
+        except Exception:
+            # Stay silent per requirement; ignore switching errors
+            pass
+
+    def _quit_key(self):
+        """Quit with confirmation"""
+        if self.quit_confirmation_time > 0 and time.monotonic() - self.quit_confirmation_time <= 3.0:
+            self.navigation_action = 'quit'
+            self.is_playing = False  # also ends the input loop
+            pygame.mixer.music.stop()
+        else:
+            self.quit_confirmation_time = time.monotonic()
+            self.quit_message_displayed = True
+            # Show quit confirmation in header for 3 seconds, in red
+            self.header_notification = "Press 'Q' again to quit (within 3 seconds)"
+            self.header_notification_until = time.monotonic() + 3.0
+            self.header_notification_color = _R
+
+    # High-level key -> handler; anything not listed is ignored
+    _ACTIONS = {
+        'LEFT': lambda self: self.seek_audio(-5.0),
+        'RIGHT': lambda self: self.seek_audio(5.0),
+        'SPACE': _toggle_pause,
+        'NEXT': _next_song,
+        'PREV': _previous_song,
+        'VSWITCH': _switch_lyrics,
+        'QUIT': _quit_key,
+        ### Experimental features - disabled for now - lyrics delay adjustment ###
+        # ']': delay lyrics by +50 ms  (self.lyric_delay = round(self.lyric_delay + 0.05, 3))
+        # '[': advance lyrics by -50 ms (self.lyric_delay = round(self.lyric_delay - 0.05, 3))
+    }
+
     def handle_input(self):
         """Handle keyboard input in a separate thread"""
         stop_event = self._input_thread_stop
@@ -1090,16 +1611,10 @@ class MusicPlayer:
             b = msvcrt.getch()
             # Extended keys start with 0x00 or 0xE0; next byte determines key
             if b in (b'\x00', b'\xe0'):
-                if not msvcrt.kbhit():
-                    # Incomplete sequence; ignore
-                    return None
-                b2 = msvcrt.getch()
-                # Map only left/right arrows; ignore everything else (prevents key combinations)
-                if b2 == b'K':
-                    return 'LEFT'
-                if b2 == b'M':
-                    return 'RIGHT'
-                return None
+                # The console always delivers the second byte with the prefix, so read it
+                # unconditionally; leaving it queued would replay 'H'/'P'/'K'/'M' as letters
+                # Map only known keys; ignore everything else (prevents key combinations)
+                return _EXT_KEYS.get(msvcrt.getch())
 
             # Regular keys
             try:
@@ -1112,99 +1627,45 @@ class MusicPlayer:
             # Filter out control characters and combinations (non-printable)
             if ord(ch) < 32:
                 return None
-            return ch.lower()
+            return _CTRL_KEYS.get(ch.lower())
+
+        try:
+            kernel32 = ctypes.windll.kernel32
+            stdin_handle = kernel32.GetStdHandle(STD_INPUT_HANDLE)
+        except Exception:
+            kernel32 = None
+
+        def _wait_for_input(timeout_ms: int):
+            """Block until console input is pending or the timeout passes (stop_event is re-checked after)."""
+            if kernel32 is None:
+                time.sleep(0.03)
+                return
+            try:
+                if kernel32.WaitForSingleObject(stdin_handle, timeout_ms) == WAIT_OBJECT_0 and not msvcrt.kbhit():
+                    # Signaled by key-up/focus/mouse records that getch never consumes; drop them
+                    # so the next wait blocks instead of returning immediately.
+                    kernel32.FlushConsoleInputBuffer(stdin_handle)
+            except Exception:
+                time.sleep(0.03)
+
+        actions = self._ACTIONS
         while self.is_playing and not stop_event.is_set():
+            key = None
             try:
                 key = _read_key_event()
                 if key is None:
-                    time.sleep(0.03)
-                    continue
-
-                if key == 'LEFT':
-                    self.seek_audio(-5.0)
-                    continue
-                if key == 'RIGHT':
-                    self.seek_audio(5.0)
+                    _wait_for_input(100)
                     continue
 
-                if key == ' ':  # Space bar - pause/resume
-                    if self.is_paused:
-                        pygame.mixer.music.unpause()
-                        # Calculate total pause duration and add to total_pause_time
-                        pause_duration = time.time() - self.pause_start_time
-                        self.total_pause_time += pause_duration
-                        self.is_paused = False
-                    else:
-                        pygame.mixer.music.pause()
-                        self.pause_start_time = time.time()
-                        self.is_paused = True
-                    continue
-
-                if key == 'n':  # Next song
-                    if self.current_song_index >= len(self.playlist) - 1:
-                        self.show_message("Reached bottom")
-                    else:
-                        self.navigation_action = 'next'
-                        self.is_playing = False
-                        pygame.mixer.music.stop()
-                    continue
-
-                if key == 'p':  # Previous song
-                    if self.current_song_index <= 0:
-                        self.show_message("Reached top")
-                    else:
-                        self.navigation_action = 'previous'
-                        self.is_playing = False
-                        pygame.mixer.music.stop()
-                    continue
-
-                if key == 'v':  # Switch to next lyrics file (cycle)
-                    try:
-                        if self.current_lyric_candidates:
-                            self.current_lyric_choice_index = (
-                                (self.current_lyric_choice_index + 1) % len(self.current_lyric_candidates)
-                            )
-                            new_path = self.current_lyric_candidates[self.current_lyric_choice_index]
-                            new_lyrics = self.load_lyrics_from_file(new_path, verbose=False)
-                            if new_lyrics:
-                                self.current_lyrics = new_lyrics
-                                self.current_lrc_path = new_path
-                                # header notification for 3 seconds
-                                self.header_notification = f"Displaying: {new_path.name}"
-                                self.header_notification_until = time.time() + 3.0
-                                self.header_notification_color = Fore.GREEN
-                    except Exception:
-                        # Stay silent per requirement; ignore switching errors
-                        pass
-                    continue
-
-                if key == 'q':  # Quit with confirmation
-                    if self.quit_confirmation_time > 0 and time.time() - self.quit_confirmation_time <= 3.0:
-                        self.navigation_action = 'quit'
-                        self.is_playing = False
-                        pygame.mixer.music.stop()
-                        return False
-                    else:
-                        self.quit_confirmation_time = time.time()
-                        self.quit_message_displayed = True
-                        # Show quit confirmation in header for 3 seconds, in red
-                        self.header_notification = "Press 'Q' again to quit (within 3 seconds)"
-                        self.header_notification_until = time.time() + 3.0
-                        self.header_notification_color = Fore.RED
-                    continue
-
-                ### Experimental features - disabled for now - lyrics delay adjustment ###
-                # if key == ']':  # delay lyrics by +50 ms
-                #     self.lyric_delay = round(self.lyric_delay + 0.05, 3)
-                #     # self.show_message(f"Lyrics delay: {self.lyric_delay:+.3f}s")
-                # elif key == '[':  # advance lyrics by -50 ms
-                #     self.lyric_delay = round(self.lyric_delay - 0.05, 3)
-                #     # self.show_message(f"Lyrics delay: {self.lyric_delay:+.3f}s")
-
-                # Ignore anything else
+                action = actions.get(key)
+                if action is not None:
+                    action(self)
             except (UnicodeDecodeError, KeyboardInterrupt):
                 pass
-            time.sleep(0.03)
+            finally:
+                if key is not None:
+                    # Wake the display loop so the change shows up immediately
+                    self._redraw_event.set()
 
         return True
 
@@ -1213,6 +1674,9 @@ class MusicPlayer:
         if not self.load_playlist():
             return
 
+        # Initialize pygame mixer per run (the finally below shuts it down again); the menu
+        # may run several players from one import of this module
+        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=1024)
         try:
             while self.current_song_index < len(self.playlist):
                 song_path = self.playlist[self.current_song_index]
@@ -1237,13 +1701,14 @@ class MusicPlayer:
                     break
 
             if self.navigation_action != 'quit':
-                print(f"\n{Fore.GREEN}Finished playing all songs!{Style.RESET_ALL}")
+                print(f"\n{_G}Finished playing all songs!{_RS}")
 
         except KeyboardInterrupt:
-            print(f"\n{Fore.YELLOW}Playback interrupted{Style.RESET_ALL}")
+            print(f"\n{_Y}Playback interrupted{_RS}")
         finally:
             pygame.mixer.music.stop()
             pygame.mixer.quit()
+            self._preload_executor.shutdown(wait=False)
             # Final safety: ensure input thread is stopped on exit
             self._stop_input_thread(join=True)
             self.show_cursor()  # Restore cursor on exit
@@ -1251,8 +1716,8 @@ class MusicPlayer:
 
 def main():
     """Main entry point"""
-    print(f"{Fore.CYAN}🎵 LRC Music Player 3.2{Style.RESET_ALL}")
-    print(f"{Fore.WHITE}Loading playlist...{Style.RESET_ALL}")
+    print(f"{_C}🎵 LRC Music Player 3.2{_RS}")
+    print(f"{_W}Loading playlist...{_RS}")
 
     base_dir = Path(__file__).resolve().parent
     player = MusicPlayer(base_dir)
@@ -1260,10 +1725,10 @@ def main():
     try:
         player.play_all()
     except Exception as e:
-        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
+        print(f"{_R}Error: {e}{_RS}")
     finally:
         player.show_cursor()  # Ensure cursor is restored
-        print(f"{Fore.WHITE}Goodbye!{Style.RESET_ALL}")
+        print(f"{_W}Goodbye!{_RS}")
 
 
 if __name__ == "__main__":
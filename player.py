@@ -4,17 +4,106 @@ from __future__ import annotations
 import os
 import sys
 import random
-from configparser import ConfigParser
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Iterable, Iterator
 
 SUPPORTED_EXTS = {".flac", ".ogg", ".aac", ".mp3"}
 SONGS_DIRNAME = "songs"
 PLAYLISTS_DIRNAME = "playlists"
 PLAYLIST_EXT = ".playlist"
+# Body of the first [Playlist] section: up to the next "[...]" header line or the end
+_PLAYLIST_SECTION_RE = re.compile(
+	r"^[^\S\n]*\[Playlist\][^\S\n]*$(.*?)(?=^[^\S\n]*\[[^\n]*\][^\S\n]*$|\Z)", re.MULTILINE | re.DOTALL
+)
+# Boolean spellings accepted for "shuffle" (the ones ConfigParser.getboolean knows)
+_TRUE_WORDS = frozenset(("1", "yes", "true", "on"))
+_FALSE_WORDS = frozenset(("0", "no", "false", "off"))
+# Characters Windows does not allow in file names
+_INVALID_NAME_CHARS = frozenset('\\/:*?"<>|')
 
 # Single config file (settings + playlist)
 NOWPLAYING_CFG_FILENAME = "player-config.cfg"
+# When to fsync written files before swapping them in:
+#  "always" - every write, "never" - leave flushing to the OS,
+#  "auto" - only user data (saved settings, created playlists), not the regenerated now-playing list
+FSYNC_POLICY = os.environ.get("LRC_PLAYER_FSYNC", "auto").strip().lower()
+
+# Parsed config (settings + [Playlist]) per path, reused while the file's (mtime_ns, size) is unchanged
+_state_cache: dict[Path, tuple[tuple[int, int], "Settings", list[str]]] = {}
+# Directory listings and .playlist parses, reused while the directory/file signature is unchanged
+_audio_list_cache: dict[Path, tuple[tuple[int, int], list[str]]] = {}
+_playlist_list_cache: dict[Path, tuple[tuple[int, int], list[Path]]] = {}
+_playlist_file_cache: dict[Path, tuple[tuple[int, int], list[str]]] = {}
+
+
+class Paths:
+	"""Files and folders under the app directory, joined once per base_dir."""
+
+	__slots__ = ("base", "songs", "playlists", "cfg", "player")
+
+	def __init__(self, base: Path):
+		self.base = base
+		self.songs = base / SONGS_DIRNAME
+		self.playlists = base / PLAYLISTS_DIRNAME
+		self.cfg = base / NOWPLAYING_CFG_FILENAME
+		self.player = base / "lrc-player.py"
+
+
+_paths_cache: dict[Path, Paths] = {}
+
+
+def paths_for(base_dir: Path) -> Paths:
+	paths = _paths_cache.get(base_dir)
+	if paths is None:
+		paths = _paths_cache[base_dir] = Paths(base_dir)
+	return paths
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+	try:
+		st = path.stat()
+	except OSError:
+		return None
+	return (st.st_mtime_ns, st.st_size)
+
+
+def _forget_cfg(path: Path) -> None:
+	"""Drop cached parses of a config file we just wrote."""
+	_state_cache.pop(path, None)
+
+
+def _section_chunks(header: str, lines: Iterable[str]) -> Iterator[str]:
+	"""Yield header, then each line followed by a newline (no joined copy of the lines)."""
+	yield header
+	for line in lines:
+		yield line
+		yield "\n"
+
+
+def _atomic_write(path: Path, chunks: Iterable[str], *, durable: bool = False) -> None:
+	"""Write the text chunks to a sibling temp file, then swap it in with os.replace.
+	Readers never see a truncated file; chunks stream through the file buffer as-is with
+	'\n' line endings (no newline translation). The temp file is fsynced first per
+	FSYNC_POLICY; durable marks user data that "auto" should sync.
+	"""
+	tmp = path.with_name(path.name + ".tmp")
+	try:
+		with tmp.open("w", encoding="utf-8", newline="\n") as f:
+			f.writelines(chunks)
+			if FSYNC_POLICY == "always" or (durable and FSYNC_POLICY == "auto"):
+				f.flush()
+				os.fsync(f.fileno())
+		os.replace(tmp, path)
+	except BaseException:
+		# Don't leave the temp file next to the config/playlist
+		try:
+			os.remove(tmp)
+		except OSError:
+			pass
+		raise
 
 
 class Settings:
@@ -22,81 +111,141 @@ class Settings:
 		self.shuffle = shuffle
 		self.playlist = playlist
 		self.audio_delay = audio_delay
+		# Set when the settings menu changes a value that is not yet saved
+		self._dirty = False
+
+	def copy(self) -> "Settings":
+		return Settings(shuffle=self.shuffle, playlist=self.playlist, audio_delay=self.audio_delay)
 
 	@staticmethod
 	def load(path: Path) -> "Settings":
 		"""Load settings from player-nowplaying.cfg.
 		- Shuffle and Playlist from [Player]
 		- Audio delay from [BlueTooth Audio Offset]/Offset
+		Callers get their own copy to modify.
+		"""
+		return load_state(path)[0]
+
+	@staticmethod
+	def from_text(text: str) -> "Settings":
+		"""Parse the [Player] and [BlueTooth Audio Offset] sections of config text.
+		Single pass over the lines; option names are case-insensitive and unreadable
+		values keep their defaults (same outcome as the former ConfigParser reads).
 		"""
-		if not path.exists():
-			return Settings()
-		# Allow playlist lines without '=' and parse sections safely
-		cp = ConfigParser(allow_no_value=True, strict=False)
-		try:
-			with path.open("r", encoding="utf-8") as f:
-				cp.read_file(f)
-		except Exception:
-			return Settings()
-		# Defaults
 		shuffle = False
 		playlist = "All songs"
 		audio_delay = 0.0
-		# Player section
-		if cp.has_section("Player"):
-			# option names are case-insensitive
-			if cp.has_option("Player", "shuffle"):
-				try:
-					shuffle = cp.getboolean("Player", "shuffle")
-				except Exception:
-					pass
-			if cp.has_option("Player", "playlist"):
+		section = None
+		for raw in text.splitlines():
+			line = raw.strip()
+			if not line or line[0] in "#;":
+				continue
+			if line[0] == "[" and line[-1] == "]":
+				section = line[1:-1]
+				if section == "Playlist":
+					# [Playlist] is written last and only holds song names
+					break
+				continue
+			key, sep, value = line.partition("=")
+			if not sep:
+				continue
+			key = key.strip().lower()
+			value = value.strip()
+			if section == "Player":
+				if key == "shuffle":
+					lowered = value.lower()
+					if lowered in _TRUE_WORDS:
+						shuffle = True
+					elif lowered in _FALSE_WORDS:
+						shuffle = False
+				elif key == "playlist":
+					playlist = value or "All songs"
+			elif section == "BlueTooth Audio Offset" and key == "offset":
 				try:
-					playlist = cp.get("Player", "playlist") or "All songs"
-				except Exception:
+					audio_delay = float(value)
+				except ValueError:
 					pass
-		# BlueTooth Audio Offset section
-		if cp.has_section("BlueTooth Audio Offset"):
-			# option names are case-insensitive
-			for key in ("offset", "Offset"):
-				if cp.has_option("BlueTooth Audio Offset", key):
-					try:
-						audio_delay = cp.getfloat("BlueTooth Audio Offset", key)
-						break
-					except Exception:
-						pass
 		return Settings(shuffle=shuffle, playlist=playlist, audio_delay=audio_delay)
 
 	def save(self, path: Path, *, playlist_lines: list[str] | None = None) -> None:
 		"""Persist settings into player-nowplaying.cfg.
 		Writes [Player], [BlueTooth Audio Offset], then [Playlist] (optional if provided).
 		"""
-		lines: list[str] = []
-		lines.append("[Player]")
-		lines.append(f"shuffle = {'true' if self.shuffle else 'false'}")
-		lines.append(f"playlist = {self.playlist if self.playlist.strip() else 'All songs'}")
-		lines.append("")
-		lines.append("[BlueTooth Audio Offset]")
-		lines.append(f"Offset = {self.audio_delay:.2f}")
-		lines.append("")
-		lines.append("[Playlist]")
-		if playlist_lines:
-			lines.extend(playlist_lines)
-		content = "\n".join(lines) + "\n"
-		with path.open("w", encoding="utf-8") as f:
-			f.write(content)
+		_atomic_write(path, self.cfg_chunks(playlist_lines), durable=True)
+		_forget_cfg(path)
+
+	def cfg_chunks(self, playlist_lines: list[str] | None = None) -> Iterator[str]:
+		"""Render the config file as chunks to write in order: one template for the
+		headers, then the playlist lines."""
+		header = (
+			"[Player]\n"
+			f"shuffle = {'true' if self.shuffle else 'false'}\n"
+			f"playlist = {self.playlist if self.playlist.strip() else 'All songs'}\n"
+			"\n"
+			"[BlueTooth Audio Offset]\n"
+			f"Offset = {self.audio_delay:.2f}\n"
+			"\n"
+			"[Playlist]\n"
+		)
+		return _section_chunks(header, playlist_lines or ())
+
+
+def list_audio_names(songs_dir: Path) -> list[str]:
+	"""Sorted file names of the supported audio files in songs_dir (no Path objects)."""
+	# Adding/removing/renaming a file changes the directory's mtime
+	sig = _file_signature(songs_dir)
+	cached = _audio_list_cache.get(songs_dir)
+	if sig is not None and cached is not None and cached[0] == sig:
+		return list(cached[1])
+	# scandir entries carry their name and (cached) file type, so no extra stat/Path per entry
+	with os.scandir(songs_dir) as it:
+		names = [
+			(e.name.lower(), e.name) for e in it
+			if os.path.splitext(e.name)[1].lower() in SUPPORTED_EXTS and e.is_file()
+		]
+	# Sort on the lowercased name computed above (ties fall back to the exact name)
+	names.sort()
+	files = [name for _, name in names]
+	if sig is not None:
+		_audio_list_cache[songs_dir] = (sig, files)
+	return list(files)
 
 
 def list_audio_files(songs_dir: Path) -> list[Path]:
-	files = []
-	for entry in sorted(songs_dir.iterdir(), key=lambda p: p.name.lower()):
-		if entry.is_file() and entry.suffix.lower() in SUPPORTED_EXTS:
-			files.append(entry)
-	return files
+	return [songs_dir / name for name in list_audio_names(songs_dir)]
+
+
+def _enable_vt_mode() -> bool:
+	"""Let the console interpret ANSI escapes (Windows 10+); True if ANSI output works."""
+	if os.name != "nt":
+		return True
+	try:
+		import ctypes
+
+		kernel32 = ctypes.windll.kernel32
+		handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+		mode = ctypes.c_uint32()
+		if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+			return False
+		# ENABLE_VIRTUAL_TERMINAL_PROCESSING
+		return bool(mode.value & 0x0004 or kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+	except Exception:
+		return False
+
+
+_ansi_clear: bool | None = None  # decided on first clear_screen()
 
 
 def clear_screen():  # simple cross-platform clear
-	os.system("cls" if os.name == "nt" else "clear")
+	global _ansi_clear
+	if _ansi_clear is None:
+		_ansi_clear = _enable_vt_mode()
+	if _ansi_clear:
+		# Erase display + cursor home; no cls/clear child process per menu repaint
+		sys.stdout.write("\033[2J\033[H")
+		sys.stdout.flush()
+	else:
+		os.system("cls" if os.name == "nt" else "clear")
 
 
 def prompt(msg: str) -> str:
@@ -106,9 +255,44 @@ def prompt(msg: str) -> str:
 		return ""
 
 
+def prompt_key(msg: str, allowed: str) -> str:
+	"""Read a single-key menu choice without waiting for Enter (Windows console).
+	Falls back to a line prompt elsewhere or when stdin is not a console.
+	"""
+	if os.name != "nt" or not sys.stdin.isatty():
+		return prompt(msg).strip()
+	import msvcrt
+
+	sys.stdout.write(msg)
+	sys.stdout.flush()
+	# Drop keys still buffered from the player so they don't pick a menu entry
+	while msvcrt.kbhit():
+		msvcrt.getwch()
+	while True:
+		ch = msvcrt.getwch()
+		if ch in ("\x00", "\xe0"):
+			msvcrt.getwch()  # second half of an arrow/function key
+			continue
+		if ch == "\x03":
+			raise KeyboardInterrupt
+		if ch in allowed:
+			print(ch)
+			return ch
+
+
 def menu_main(base_dir: Path):
-	cfg_path = base_dir / NOWPLAYING_CFG_FILENAME
+	cfg_path = paths_for(base_dir).cfg
 	settings = Settings.load(cfg_path)
+	cfg_sig = _file_signature(cfg_path)
+
+	def reload_if_changed() -> None:
+		# Keep the in-memory settings unless the config file was rewritten meanwhile
+		nonlocal settings, cfg_sig
+		sig = _file_signature(cfg_path)
+		if sig != cfg_sig:
+			settings = Settings.load(cfg_path)
+			cfg_sig = sig
+
 	while True:
 		clear_screen()
 		print("== Player Settings ==")
@@ -125,35 +309,37 @@ def menu_main(base_dir: Path):
 		print("")
 		print(" 9. settings")
 		print(" 0. Exit")
-		choice = prompt("Select: ").strip()
+		choice = prompt_key("Select: ", "0123459")
 		if choice == "1":
 			# Directly run the lrc-player without reshuffling or regenerating playlist
 			clear_screen()
 			print("Starting player (no playlist changes)...")
 			launch_lrc_player(base_dir)
 			# After returning from player, re-load settings (in case modified elsewhere)
-			settings = Settings.load(cfg_path)
+			reload_if_changed()
 		elif choice == "2":
 			# One-time shuffle regardless of shuffle setting
 			run_with_settings(base_dir, settings, force_shuffle=True)
-			settings = Settings.load(cfg_path)
+			reload_if_changed()
 		elif choice == "3":
 			# Play all songs (respect current shuffle setting)
 			temp_settings = Settings(shuffle=settings.shuffle, playlist="All songs", audio_delay=settings.audio_delay)
 			run_with_settings(base_dir, temp_settings)
-			settings = Settings.load(cfg_path)
+			reload_if_changed()
 		elif choice == "4":
 			# Play from a chosen playlist
 			choose_playlist_and_run_flow(base_dir, settings)
-			settings = Settings.load(cfg_path)
+			reload_if_changed()
 		elif choice == "5":
 			create_playlist_flow(base_dir)
 		elif choice == "9":
 			# Settings menu (in-memory only; persist on run or exit)
 			menu_settings(base_dir, settings)
 		elif choice == "0":
-			# Save current settings into nowplaying file, preserving existing playlist if present
-			persist_settings_only(base_dir, settings)
+			# Save current settings into nowplaying file, preserving existing playlist if present;
+			# nothing to write when the settings menu changed nothing
+			if settings._dirty:
+				persist_settings_only(base_dir, settings)
 			clear_screen()
 			print("Bye.")
 			return
@@ -170,9 +356,10 @@ def menu_settings(base_dir: Path, settings: Settings) -> None:
 		print(f" 2. Audio (lyrics) Delay: {settings.audio_delay:.2f}s")
 		print("")
 		print(" 0. Go Back")
-		sel = prompt("Select: ").strip()
+		sel = prompt_key("Select: ", "012")
 		if sel == "1":
 			settings.shuffle = not settings.shuffle
+			settings._dirty = True
 		elif sel == "2":
 			clear_screen()
 			print("== Settings: Bluetooth Audio Delay Settings ==")
@@ -187,7 +374,9 @@ def menu_settings(base_dir: Path, settings: Settings) -> None:
 			try:
 				num = float(val)
 				# Clamp to sensible range if desired (optional); keep as is for now
-				settings.audio_delay = round(num, 2)
+				if round(num, 2) != settings.audio_delay:
+					settings.audio_delay = round(num, 2)
+					settings._dirty = True
 			except ValueError:
 				# Just ignore invalid input and repaint
 				pass
@@ -200,32 +389,18 @@ def menu_settings(base_dir: Path, settings: Settings) -> None:
 
 def generate_nowplaying(base_dir: Path, settings: Settings, song_names: list[str]) -> Path:
 	"""Create player-nowplaying.cfg with [Player], [BlueTooth Audio Offset], and [Playlist]."""
-	cfg_path = base_dir / NOWPLAYING_CFG_FILENAME
-	lines: list[str] = []
-	# [Player]
-	lines.append("[Player]")
-	lines.append(f"shuffle = {'true' if settings.shuffle else 'false'}")
-	lines.append(f"playlist = {settings.playlist if settings.playlist.strip() else 'All songs'}")
-	lines.append("")
-	# [BlueTooth Audio Offset]
-	lines.append("[BlueTooth Audio Offset]")
-	lines.append(f"Offset = {settings.audio_delay:.2f}")
-	lines.append("")
-	# [Playlist]
-	lines.append("[Playlist]")
-	lines.extend(song_names)
-	content = "\n".join(lines) + "\n"
-	with cfg_path.open("w", encoding="utf-8") as f:
-		f.write(content)
+	cfg_path = paths_for(base_dir).cfg
+	_atomic_write(cfg_path, settings.cfg_chunks(song_names))
+	_forget_cfg(cfg_path)
 	return cfg_path
 
 
 def build_song_list(base_dir: Path) -> list[str]:
 	"""Return list of song filenames from songs directory (sorted by name)."""
-	songs_dir = base_dir / SONGS_DIRNAME
+	songs_dir = paths_for(base_dir).songs
 	if not songs_dir.exists():
 		return []
-	return [p.name for p in list_audio_files(songs_dir)]
+	return list_audio_names(songs_dir)
 
 
 def run_with_settings(base_dir: Path, settings: Settings, *, force_shuffle: bool = False) -> None:
@@ -234,57 +409,118 @@ def run_with_settings(base_dir: Path, settings: Settings, *, force_shuffle: bool
 		songs = build_song_list(base_dir)
 	else:
 		# Use current [Playlist] from config as the active playlist
-		songs = _read_existing_playlist(base_dir)
+		songs = load_state(paths_for(base_dir).cfg)[1]
 	if settings.shuffle or force_shuffle:
 		random.shuffle(songs)
-	# Persist full nowplaying (settings + playlist) before launching
-	cfg_path = generate_nowplaying(base_dir, settings, songs)
-	# Launch lrc-player.py
+	# Clear first so anything the player import prints (e.g. a missing dependency) stays visible
 	clear_screen()
+	# Persist full nowplaying (settings + playlist) before launching; the write runs on a
+	# worker thread while this thread imports the player (pygame init), which is the slow part
+	with ThreadPoolExecutor(max_workers=1) as pool:
+		cfg_future = pool.submit(generate_nowplaying, base_dir, settings, songs)
+		script_path = paths_for(base_dir).player
+		if script_path.exists():
+			_load_lrc_player(script_path)
+		cfg_path = cfg_future.result()
+	# Launch lrc-player.py
 	print(f"Starting player with {len(songs)} song(s). Now playing config: {cfg_path.name}")
 	launch_lrc_player(base_dir)
 
 
-def _read_existing_playlist(base_dir: Path) -> list[str]:
-	"""Read any existing [Playlist] entries from player-nowplaying.cfg if present."""
-	cfg_path = base_dir / NOWPLAYING_CFG_FILENAME
-	if not cfg_path.exists():
-		return []
-	try:
-		with cfg_path.open("r", encoding="utf-8") as f:
-			lines = f.read().splitlines()
-	except Exception:
+def _playlist_section(text: str) -> list[str]:
+	"""Return the non-blank entries of the [Playlist] section, in order."""
+	m = _PLAYLIST_SECTION_RE.search(text)
+	if not m:
 		return []
-	playlist_lines: list[str] = []
-	in_playlist = False
-	for line in lines:
-		if line.strip().startswith("[") and line.strip().endswith("]"):
-			in_playlist = (line.strip() == "[Playlist]")
-			continue
-		if in_playlist:
-			if line.strip() == "":
-				# keep blank lines out of playlist
-				continue
-			playlist_lines.append(line)
-	return playlist_lines
+	# keep blank lines out of playlist
+	return [line for line in m.group(1).splitlines() if line.strip()]
+
+
+def load_state(path: Path) -> tuple[Settings, list[str]]:
+	"""Read player-nowplaying.cfg once and return (settings, [Playlist] entries).
+	Parsed once per file version; callers get their own copies to modify.
+	"""
+	sig = _file_signature(path)
+	if sig is None:
+		return Settings(), []
+	cached = _state_cache.get(path)
+	if cached is None or cached[0] != sig:
+		try:
+			text = path.read_text(encoding="utf-8")
+		except Exception:
+			return Settings(), []
+		cached = (sig, Settings.from_text(text), _playlist_section(text))
+		_state_cache[path] = cached
+	return cached[1].copy(), list(cached[2])
 
 
 def persist_settings_only(base_dir: Path, settings: Settings) -> None:
 	"""Save only [Player] and [BlueTooth Audio Offset], preserving [Playlist] content if any."""
-	existing_playlist = _read_existing_playlist(base_dir)
-	settings.save(base_dir / NOWPLAYING_CFG_FILENAME, playlist_lines=existing_playlist)
+	cfg_path = paths_for(base_dir).cfg
+	existing_playlist = load_state(cfg_path)[1]
+	settings.save(cfg_path, playlist_lines=existing_playlist)
 
 
-def launch_lrc_player(base_dir: Path) -> None:
-	# We simply execute the Python script using subprocess (no shell) to avoid cmd quoting issues
-	import subprocess
+# lrc-player.py loaded as a module, kept across launches so later runs skip the import
+# (False once importing it failed, so it is not retried)
+_lrc_player_module = None
+# Exit code when the script itself exited while being imported (it has already said why)
+_lrc_player_exit_code = None
 
-	script_path = base_dir / "lrc-player.py"
+
+def _load_lrc_player(script_path: Path):
+	"""Import lrc-player.py in-process (its hyphenated name needs a file-location spec).
+	Returns None if it cannot be imported here.
+	"""
+	global _lrc_player_module, _lrc_player_exit_code
+	if _lrc_player_module is None:
+		import importlib.util
+
+		try:
+			spec = importlib.util.spec_from_file_location("lrc_player", script_path)
+			if spec is None or spec.loader is None:
+				raise ImportError(f"cannot load {script_path}")
+			module = importlib.util.module_from_spec(spec)
+			spec.loader.exec_module(module)
+			_lrc_player_module = module
+		except SystemExit as e:
+			# e.g. pygame missing: the script printed the reason and exited on import
+			_lrc_player_module = False
+			_lrc_player_exit_code = e.code
+		except Exception:
+			# Not importable here; launch_lrc_player falls back to a subprocess
+			_lrc_player_module = False
+	return _lrc_player_module or None
+
+
+def launch_lrc_player(base_dir: Path) -> None:
+	script_path = paths_for(base_dir).player
 	if not script_path.exists():
 		print("lrc-player.py not found.")
 		prompt("Press Enter to return...")
 		return
 
+	# Run the player in this interpreter when it imports cleanly; this skips a new
+	# Python process and a second round of pygame/colorama imports per launch.
+	module = _load_lrc_player(script_path)
+	if module is not None:
+		try:
+			module.main()
+		except SystemExit as e:
+			if e.code not in (None, 0):
+				print(f"lrc-player exited with code {e.code}")
+				prompt("Press Enter to return...")
+		return
+	if _lrc_player_exit_code is not None:
+		# A subprocess would stop at the same point and print the same message again
+		print(f"lrc-player exited with code {_lrc_player_exit_code}")
+		prompt("Press Enter to return...")
+		return
+
+	# Fallback: execute the Python script using subprocess (no shell) to avoid cmd quoting issues.
+	# Not os.execv: the menu must still be here when the player exits.
+	import subprocess
+
 	try:
 		# Run with the same interpreter; no shell => no cmd quoting problems
 		result = subprocess.run(
@@ -316,51 +552,67 @@ ANSI_RESET = "\033[0m"
 
 
 def ensure_playlists_dir(base_dir: Path) -> Path:
-	d = base_dir / PLAYLISTS_DIRNAME
+	d = paths_for(base_dir).playlists
 	d.mkdir(parents=True, exist_ok=True)
 	return d
 
 
 def list_playlist_files(base_dir: Path) -> list[Path]:
 	d = ensure_playlists_dir(base_dir)
-	files = [p for p in sorted(d.iterdir(), key=lambda p: p.name.lower()) if p.is_file() and p.suffix == PLAYLIST_EXT]
-	return files
+	sig = _file_signature(d)
+	cached = _playlist_list_cache.get(d)
+	if sig is not None and cached is not None and cached[0] == sig:
+		return list(cached[1])
+	# Same single scandir pass as list_audio_names: name check first, is_file() only on candidates
+	with os.scandir(d) as it:
+		names = [(e.name.lower(), e.name) for e in it if os.path.splitext(e.name)[1] == PLAYLIST_EXT and e.is_file()]
+	names.sort()
+	files = [d / name for _, name in names]
+	if sig is not None:
+		_playlist_list_cache[d] = (sig, files)
+	return list(files)
 
 
 def parse_playlist_file(path: Path) -> tuple[str, list[str]]:
 	"""Return (name, songs) from a .playlist file. If name missing, use stem."""
 	name = path.stem  # Always use filename as playlist name
 	songs: list[str] = []
+	sig = _file_signature(path)
+	cached = _playlist_file_cache.get(path)
+	if sig is not None and cached is not None and cached[0] == sig:
+		return (name, list(cached[1]))
 	try:
+		# Stream the file; [Playlist] is written last, so stop at any section after it
 		with path.open("r", encoding="utf-8") as f:
-			lines = f.read().splitlines()
+			in_playlist = False
+			for raw in f:
+				line = raw.rstrip("\r\n")
+				s = line.strip()
+				if s.startswith("[") and s.endswith("]"):
+					if in_playlist:
+						break
+					in_playlist = (s == "[Playlist]")
+					continue
+				if in_playlist and s != "" and not s.startswith("["):
+					songs.append(line)
 	except Exception:
-		return (name, songs)
-
-	in_playlist = False
-	for line in lines:
-		s = line.strip()
-		if s.startswith("[") and s.endswith("]"):
-			in_playlist = (s == "[Playlist]")
-			continue
-		if in_playlist and s != "" and not s.startswith("["):
-			songs.append(line)
-	return (name, songs)
+		return (name, [])
+	if sig is not None:
+		_playlist_file_cache[path] = (sig, songs)
+	return (name, list(songs))
 
 
 def write_playlist_file(base_dir: Path, playlist_name: str, songs: list[str]) -> Path:
 	folder = ensure_playlists_dir(base_dir)
 	filename = f"{playlist_name}{PLAYLIST_EXT}"
 	path = folder / filename
-	lines: list[str] = []
-	lines.append("[Playlist_Property]")
-	lines.append(f"createdDateTime = \"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\"")
-	lines.append("")
-	lines.append("[Playlist]")
-	lines.extend(songs)
-	content = "\n".join(lines) + "\n"
-	with path.open("w", encoding="utf-8") as f:
-		f.write(content)
+	header = (
+		"[Playlist_Property]\n"
+		f"createdDateTime = \"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\"\n"
+		"\n"
+		"[Playlist]\n"
+	)
+	_atomic_write(path, _section_chunks(header, songs), durable=True)
 	return path
 
 
@@ -377,27 +629,28 @@ def _display_song_selection(title: str, items: list[str]) -> list[str] | None:
 		prompt("Press Enter to go back...")
 		return None
 
-	selected = [False] * len(items)
+	# One byte per item (1 = Adding); both renderings of every row are built once
+	selected = bytearray(len(items))
+	rows_adding = [f" {i}. {name}: Adding" for i, name in enumerate(items, 1)]
+	rows_not_adding = [
+		f" {i}. {ANSI_RED}{name}{ANSI_RESET}: {ANSI_RED}NOT Adding{ANSI_RESET}"
+		for i, name in enumerate(items, 1)
+	]
+	add_all_num = len(items) + 1
+	not_add_all_num = len(items) + 2
+	confirm_num = len(items) + 3
+	footer = (
+		" ---\n"
+		f" {add_all_num}. Add ALL\n"
+		f" {not_add_all_num}. Not Adding ALL\n"
+		f" {confirm_num}. Confirm and Add selected\n"
+		" 0. Cancel and go back\n"
+	)
 	while True:
 		clear_screen()
-		print(title)
-		print("")
-		for i, name in enumerate(items, 1):
-			if selected[i - 1]:
-				display_name = name
-				flag = "Adding"
-			else:
-				display_name = f"{ANSI_RED}{name}{ANSI_RESET}"
-				flag = f"{ANSI_RED}NOT Adding{ANSI_RESET}"
-			print(f" {i}. {display_name}: {flag}")
-		print(" ---")
-		add_all_num = len(items) + 1
-		not_add_all_num = len(items) + 2
-		confirm_num = len(items) + 3
-		print(f" {add_all_num}. Add ALL")
-		print(f" {not_add_all_num}. Not Adding ALL")
-		print(f" {confirm_num}. Confirm and Add selected")
-		print(" 0. Cancel and go back")
+		# Whole screen in a single write instead of one print per song
+		rows = [rows_adding[i] if on else rows_not_adding[i] for i, on in enumerate(selected)]
+		sys.stdout.write(f"{title}\n\n" + "\n".join(rows) + "\n" + footer)
 		inp = prompt("Select (toggle index / action, use space to toggle multiple ones): ").strip()
 		if not inp:
 			continue
@@ -417,7 +670,7 @@ def _display_song_selection(title: str, items: list[str]) -> list[str] | None:
 					indices.add(n)
 			# apply unique toggles
 			for n in sorted(indices):
-				selected[n - 1] = not selected[n - 1]
+				selected[n - 1] ^= 1
 			continue
 		# Single-action handling
 		if inp == "0":
@@ -427,11 +680,11 @@ def _display_song_selection(title: str, items: list[str]) -> list[str] | None:
 		except ValueError:
 			continue
 		if 1 <= num <= len(items):
-			selected[num - 1] = not selected[num - 1]
+			selected[num - 1] ^= 1
 		elif num == add_all_num:
-			selected = [True] * len(items)
+			selected = bytearray(b"\x01") * len(items)
 		elif num == not_add_all_num:
-			selected = [False] * len(items)
+			selected = bytearray(len(items))
 		elif num == confirm_num:
 			result = [name for ok, name in zip(selected, items) if ok]
 			if not result:
@@ -453,8 +706,7 @@ def _prompt_new_playlist_name(base_dir: Path) -> str | None:
 		if name == ":x":
 			return None
 		# invalid character check for Windows filenames
-		invalid = set('\\/:*?"<>|')
-		if any(ch in invalid for ch in name):
+		if not _INVALID_NAME_CHARS.isdisjoint(name):
 			clear_screen()
 			print("Playlist name contains invalid characters: \\ / : * ? \" < > |")
 			print("Please enter a valid name without those characters.")
@@ -462,7 +714,7 @@ def _prompt_new_playlist_name(base_dir: Path) -> str | None:
 			prompt("Press Enter to enter a new name...")
 			continue
 		# duplicate check
-		folder = base_dir / PLAYLISTS_DIRNAME
+		folder = paths_for(base_dir).playlists
 		target = folder / f"{name}{PLAYLIST_EXT}"
 		if target.exists():
 			clear_screen()
@@ -555,8 +807,8 @@ def _choose_playlist_file_menu(base_dir: Path, files: list[Path], *, title: str)
 			sel = prompt("Select: ").strip()
 			return None
 		for i, p in enumerate(files, 1):
-			name, _ = parse_playlist_file(p)
-			print(f" {i}. {name}")
+			# The playlist name is the file stem; no need to open the file to list it
+			print(f" {i}. {p.stem}")
 		print(" ---")
 		print(" 0. Cancel and go back")
 		sel = prompt("Select: ").strip()
@@ -586,8 +838,7 @@ def choose_playlist_and_run_flow(base_dir: Path, settings: Settings) -> None:
 		entries: list[tuple[str, str]] = []  # (kind, identifier). kind: 'current' or 'file'
 
 		# Add Current Playlist if the config exists and has entries
-		current_cfg = base_dir / NOWPLAYING_CFG_FILENAME
-		current_playlist_lines = _read_existing_playlist(base_dir) if current_cfg.exists() else []
+		current_playlist_lines = load_state(paths_for(base_dir).cfg)[1]
 		idx = 1
 		if current_playlist_lines:
 			print(f" {idx}. Current Playlist.")
@@ -597,8 +848,7 @@ def choose_playlist_and_run_flow(base_dir: Path, settings: Settings) -> None:
 		# List saved playlists
 		files = list_playlist_files(base_dir)
 		for p in files:
-			name, _ = parse_playlist_file(p)
-			print(f" {idx}. {name}")
+			print(f" {idx}. {p.stem}")
 			entries.append(("file", str(p)))
 			idx += 1
 
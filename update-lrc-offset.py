@@ -34,10 +34,14 @@ import argparse
 import os
 import re
 import sys
-from typing import Match, Optional
+from typing import Callable, Iterator, Match, Optional, TextIO
 
 
 OFFSET_LINE_RE = re.compile(r"^\[offset:(?P<val>[-+]?\d+(?:\.\d+)?)\]\s*$", re.IGNORECASE)
+# Same as OFFSET_LINE_RE but for whole '\n'-joined text (trailing blanks may not eat the newline)
+OFFSET_LINE_MULTI_RE = re.compile(
+	r"^\[offset:(?P<val>[-+]?\d+(?:\.\d+)?)\][^\S\n]*$", re.IGNORECASE | re.MULTILINE
+)
 
 # Matches both [mm:ss(.fff)] and <mm:ss(.fff)> but NOT things like [length:..] because
 # it requires the first char after '[' to be a digit.
@@ -45,6 +49,13 @@ TIME_TAG_RE = re.compile(
 	r"(?P<open>[\[<])(?P<m>\d{1,3}):(?P<s>\d{2})(?:\.(?P<frac>\d{1,4}))?(?P<close>[\]>])"
 )
 
+# Approximate characters read per chunk when streaming a file through process_lrc_stream
+STREAM_CHUNK_CHARS = 1 << 16
+
+# Units per second and fraction format, indexed by precision (digits after the dot, 0..4)
+FRAC_BASES = (1, 10, 100, 1000, 10000)
+FRAC_FORMATS = ("", ".{:01d}", ".{:02d}", ".{:03d}", ".{:04d}")
+
 
 def parse_offset_seconds(raw: str, units: str = "auto") -> float:
 	"""Parse offset string to seconds.
@@ -74,75 +85,125 @@ def parse_offset_seconds(raw: str, units: str = "auto") -> float:
 	return val
 
 
-def apply_offset_to_tag(m: Match[str], offset_seconds: float) -> str:
-	open_br = m.group("open")
-	close_br = m.group("close")
-	# sanity: make sure we don't mismatch brackets (not expected in valid LRC)
-	if (open_br == "[" and close_br != "]") or (open_br == "<" and close_br != ">"):
-		return m.group(0)
+def offset_units_by_precision(offset_seconds: float) -> tuple[int, ...]:
+	"""Offset expressed in each tag precision's units, computed once per file.
 
-	mm = int(m.group("m"))
-	ss = int(m.group("s"))
-	frac_str = m.group("frac") or ""
-	precision = len(frac_str)
-	base = 10 ** precision if precision > 0 else 1
-
-	# total units in this tag's precision
-	frac_units = int(frac_str) if precision > 0 else 0
-	total_units = ((mm * 60) + ss) * base + frac_units
+	The offset is fixed to 1/10000 s first, then scaled down with integer math
+	(round half to even, like round()).
+	"""
+	top = FRAC_BASES[-1]
+	offset_top = int(round(offset_seconds * top))
+	units = []
+	for base in FRAC_BASES:
+		q, r = divmod(offset_top, top // base)
+		if 2 * r > top // base or (2 * r == top // base and q & 1):
+			q += 1
+		units.append(q)
+	return tuple(units)
 
-	# convert offset seconds to this tag's unit resolution
-	offset_units = int(round(offset_seconds * base))
-	new_units = total_units + offset_units
-	if new_units < 0:
-		new_units = 0
 
-	# back to mm:ss.frac
-	new_total_seconds, new_frac_units = divmod(new_units, base)
-	new_mm, new_ss = divmod(new_total_seconds, 60)
+def _precision_shifter(precision: int, offset: int) -> Callable[[str, str, str, Optional[str], str], str]:
+	"""Tag shifter specialized for one fractional precision (base, format and offset baked in).
 
-	# format fraction preserving precision
-	if precision > 0:
-		frac_fmt = f"{{:0{precision}d}}"
-		frac_part = "." + frac_fmt.format(new_frac_units)
-	else:
-		frac_part = ""
+	Called with the tag's groups; offset is in that precision's units.
+	"""
+	if precision == 0:
+		def shift_whole(open_br: str, mm: str, ss: str, _frac: Optional[str], close_br: str) -> str:
+			total = int(mm) * 60 + int(ss) + offset
+			if total < 0:
+				total = 0
+			new_mm, new_ss = divmod(total, 60)
+			return f"{open_br}{new_mm:02d}:{new_ss:02d}{close_br}"
+
+		return shift_whole
+
+	base = FRAC_BASES[precision]
+	# e.g. "{}{:02d}:{:02d}.{:02d}{}" for 2 digits: preserves the tag's precision
+	fmt = "{}{:02d}:{:02d}" + FRAC_FORMATS[precision] + "{}"
+
+	def shift_frac(open_br: str, mm: str, ss: str, frac: str, close_br: str) -> str:
+		# total units in this tag's precision, clamped at 00:00
+		total = (int(mm) * 60 + int(ss)) * base + int(frac) + offset
+		if total < 0:
+			total = 0
+		# back to mm:ss.frac
+		seconds, frac_units = divmod(total, base)
+		new_mm, new_ss = divmod(seconds, 60)
+		return fmt.format(open_br, new_mm, new_ss, frac_units, close_br)
+
+	return shift_frac
+
+
+def make_tag_shifter(offset_seconds: float) -> Callable[[Match[str]], str]:
+	"""Build the re.sub callback that shifts one TIME_TAG_RE match by offset_seconds."""
+	offsets = offset_units_by_precision(offset_seconds)
+	shifters = tuple(_precision_shifter(p, offsets[p]) for p in range(len(FRAC_BASES)))
+
+	def shift_tag(m: Match[str]) -> str:
+		open_br, mm, ss, frac, close_br = m.groups()
+		# sanity: make sure we don't mismatch brackets (not expected in valid LRC)
+		if (open_br == "[") != (close_br == "]"):
+			return m.group(0)
+		return shifters[len(frac) if frac else 0](open_br, mm, ss, frac, close_br)
+
+	return shift_tag
+
+
+def _rewrite(text: str, offset_seconds: Optional[float]) -> str:
+	"""Apply offset_seconds to all time tags of '\n'-joined text and zero the [offset:*] lines."""
+	if offset_seconds is None:
+		# No offset line in the file: nothing to shift or zero
+		return text
+	if abs(offset_seconds) < 1e-12:
+		# Effectively zero: still normalize any existing [offset:*] to [offset:0]
+		return OFFSET_LINE_MULTI_RE.sub("[offset:0]", text)
+
+	# Apply the offset to all time tags
+	new_text = TIME_TAG_RE.sub(make_tag_shifter(offset_seconds), text)
 
-	return f"{open_br}{new_mm:02d}:{new_ss:02d}{frac_part}{close_br}"
+	# Reset all [offset:*] lines to zero
+	return OFFSET_LINE_MULTI_RE.sub("[offset:0]", new_text)
 
 
 def process_lrc(text: str, units: str = "auto") -> str:
+	# Normalize line endings once (output is '\n'-joined), then work on the whole text:
+	# one regex pass per rewrite instead of one per line
+	text = "\n".join(text.splitlines())
+
 	# Find offset line (first occurrence); if multiple, use the first and zero all of them later
-	offset_seconds: float = 0.0
-	found_offset_line = None  # type: Optional[str]
-	lines = text.splitlines()
-	for i, line in enumerate(lines):
-		m = OFFSET_LINE_RE.match(line)
-		if m:
-			found_offset_line = line
-			offset_seconds = parse_offset_seconds(m.group("val"), units=units)
-			break
-
-	if found_offset_line is None or abs(offset_seconds) < 1e-12:
-		# No offset, or effectively zero: still normalize any existing [offset:*] to [offset:0]
-		def zero_offset_line(line: str) -> str:
-			mm = OFFSET_LINE_RE.match(line)
-			return "[offset:0]" if mm else line
-
-		return "\n".join(zero_offset_line(line) for line in lines)
-
-	# Apply the offset to all time tags in all lines
-	def sub_fn(m: Match[str]) -> str:
-		return apply_offset_to_tag(m, offset_seconds)
-
-	new_lines = [TIME_TAG_RE.sub(sub_fn, line) for line in lines]
+	m = OFFSET_LINE_MULTI_RE.search(text)
+	offset_seconds = parse_offset_seconds(m.group("val"), units=units) if m else None
+	return _rewrite(text, offset_seconds)
+
+
+def read_offset_seconds(f: TextIO, units: str = "auto") -> Optional[float]:
+	"""Offset of the first [offset:*] line in f, or None. Stops reading at that line."""
+	for raw in f:
+		for line in raw.splitlines():
+			# Cheap prefix test first; the regex only runs on candidate [offset:...] lines
+			if line[:8].lower() != "[offset:":
+				continue
+			m = OFFSET_LINE_RE.match(line)
+			if m:
+				return parse_offset_seconds(m.group("val"), units=units)
+	return None
 
-	# Reset all [offset:*] lines to zero
-	for i, line in enumerate(new_lines):
-		if OFFSET_LINE_RE.match(line):
-			new_lines[i] = "[offset:0]"
 
-	return "\n".join(new_lines)
+def process_lrc_stream(f: TextIO, offset_seconds: Optional[float]) -> Iterator[tuple[str, bool]]:
+	"""Yield the adjusted file in chunks of whole lines, each with whether it changed.
+
+	Joining the chunks gives the same text as process_lrc(f.read()), but only one chunk
+	(STREAM_CHUNK_CHARS, roughly) is held in memory at a time.
+	"""
+	first = True
+	while True:
+		block = f.readlines(STREAM_CHUNK_CHARS)
+		if not block:
+			return
+		text = "\n".join(line for raw in block for line in raw.splitlines())
+		new_text = _rewrite(text, offset_seconds)
+		yield (new_text if first else "\n" + new_text), new_text != text
+		first = False
 
 
 def main(argv: Optional[list[str]] = None) -> int:
@@ -168,58 +229,79 @@ def main(argv: Optional[list[str]] = None) -> int:
 		print(f"Input file not found: {in_path}", file=sys.stderr)
 		return 2
 
+	# First pass: find the offset (usually within the first few header lines)
 	with open(in_path, "r", encoding="utf-8") as f:
-		text = f.read()
-
-	out_text = process_lrc(text, units=args.units)
-
-	# Detect whether the file actually changes and whether the effective offset is zero
-	offset_is_zero = False
-	for line in text.splitlines():
-		m = OFFSET_LINE_RE.match(line)
-		if m:
-			try:
-				offset_is_zero = abs(parse_offset_seconds(m.group("val"), units=args.units)) < 1e-12
-			except Exception:
-				# On parse error, fall back to treating as non-zero to be safe
-				offset_is_zero = False
-			break
-
-	no_change = (out_text == text)
+		offset_seconds = read_offset_seconds(f, units=args.units)
+	# Whether the effective offset is zero (timestamps stay as they are)
+	offset_is_zero = offset_seconds is not None and abs(offset_seconds) < 1e-12
 
 	out_path = args.output
 	if out_path:
 		os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
-		with open(out_path, "w", encoding="utf-8", newline="\n") as f:
-			f.write(out_text)
+		# Stream into a temp file and swap it in, so -o may name the input file itself
+		tmp = out_path + ".tmp"
+		try:
+			with open(in_path, "r", encoding="utf-8") as f, open(tmp, "w", encoding="utf-8", newline="\n") as out:
+				for chunk, _changed in process_lrc_stream(f, offset_seconds):
+					out.write(chunk)
+			os.replace(tmp, out_path)
+		except BaseException:
+			try:
+				os.remove(tmp)
+			except OSError:
+				pass
+			raise
 		print(f"Wrote: {out_path}")
 		return 0
 
 	if args.in_place:
-		# If nothing would change, skip writing and don't create a backup
-		if no_change:
+		# No [offset:*] line at all: no tag would move and no offset line needs zeroing
+		if offset_seconds is None:
 			print("No changes detected; skipped in-place update.")
 			return 0
-
+		# Second pass: stream into a temp file next to the input, then swap it in
+		tmp = in_path + ".tmp"
 		backup = in_path + ".bak"
+		backed_up = False
 		try:
-			# Create a backup only when there's a non-zero offset (actual timestamp adjustments)
-			if not offset_is_zero:
-				with open(backup, "w", encoding="utf-8", newline="\n") as f:
-					f.write(text)
-			with open(in_path, "w", encoding="utf-8", newline="\n") as f:
-				f.write(out_text)
-			if offset_is_zero:
+			changed = False
+			with open(in_path, "r", encoding="utf-8") as f, open(tmp, "w", encoding="utf-8", newline="\n") as out:
+				for chunk, chunk_changed in process_lrc_stream(f, offset_seconds):
+					out.write(chunk)
+					changed = changed or chunk_changed
+			# If nothing would change, skip writing and don't create a backup
+			if not changed:
+				os.remove(tmp)
+				print("No changes detected; skipped in-place update.")
+				return 0
+			# Keep the original as the backup only when there's a non-zero offset (actual timestamp adjustments)
+			if offset_seconds is not None and not offset_is_zero:
+				os.replace(in_path, backup)
+				backed_up = True
+			os.replace(tmp, in_path)
+			if offset_seconds is None or offset_is_zero:
 				print("Updated in place without creating a backup (offset is zero).")
 			else:
 				print(f"Updated in place. Backup saved to: {backup}")
 			return 0
 		except Exception as e:
+			try:
+				os.remove(tmp)
+			except OSError:
+				pass
+			# Never leave the input path missing: put the original back from the backup
+			if backed_up and not os.path.exists(in_path):
+				try:
+					os.replace(backup, in_path)
+				except OSError:
+					pass
 			print(f"Failed to write in place: {e}", file=sys.stderr)
 			return 1
 
 	# Default: print to stdout
-	sys.stdout.write(out_text)
+	with open(in_path, "r", encoding="utf-8") as f:
+		for chunk, _changed in process_lrc_stream(f, offset_seconds):
+			sys.stdout.write(chunk)
 	return 0
 
 